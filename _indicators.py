@@ -0,0 +1,304 @@
+"""
+Numeric indicator kernels operating on raw NumPy arrays.
+
+The kernels are compiled with numba when it is installed; otherwise they run
+as plain Python loops over NumPy arrays, which is still far cheaper than
+per-row pandas access.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def ema(values, span):
+    """Recursive exponential moving average, matching pandas ewm(span=span, adjust=False)"""
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 2.0 / (span + 1.0)
+    out[0] = values[0]
+    for i in range(1, n):
+        out[i] = alpha * values[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True)
+def sma(values, period):
+    """Simple moving average over `period` bars from prefix sums; NaN until the window fills"""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if period < 1 or n < period:
+        return out
+    cs = np.concatenate((np.zeros(1), np.cumsum(values)))
+    out[period - 1:] = (cs[period:] - cs[:n - period + 1]) / period
+    return out
+
+
+@njit(cache=True)
+def rsi(close, period):
+    """RSI with Wilder's smoothing of gains/losses; 50 where undefined"""
+    n = close.shape[0]
+    out = np.full(n, 50.0)
+    if n <= period:
+        return out
+
+    # Seed with the simple average of the first `period` changes
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        elif delta < 0:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    return out
+
+
+@njit(cache=True)
+def obv(close, volume):
+    """On Balance Volume, seeded with the first volume"""
+    n = close.shape[0]
+    if n == 0:
+        return np.empty(0)
+    vol = np.nan_to_num(volume)
+    sign = np.zeros(n)
+    sign[1:] = np.nan_to_num(np.sign(close[1:] - close[:-1]))
+    return np.cumsum(sign * vol) + vol[0]
+
+
+@njit(cache=True)
+def vwap(high, low, close, volume, period):
+    """Rolling VWAP over `period` bars; falls back to typical price when volume is zero"""
+    n = close.shape[0]
+    typical = (high + low + close) / 3.0
+    # Window sums as differences of prefix sums: one O(n) pass, no per-bar slicing
+    cs_pv = np.concatenate((np.zeros(1), np.cumsum(typical * volume)))
+    cs_v = np.concatenate((np.zeros(1), np.cumsum(volume)))
+    end = np.arange(n) + 1
+    start = np.maximum(0, end - period)
+    num = cs_pv[end] - cs_pv[start]
+    den = cs_v[end] - cs_v[start]
+    return np.where(den > 0, num / np.where(den > 0, den, 1.0), typical)
+
+
+@njit(cache=True, fastmath=True)
+def trend_slope(y):
+    """Least-squares slope of y against its bar index; 0 for fewer than 2 points"""
+    n = y.shape[0]
+    if n < 2:
+        return 0.0
+    # x = 0..n-1, so its sums have closed forms and only y needs reducing
+    sum_x = n * (n - 1) * 0.5
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6.0
+    sum_y = y.sum()
+    sum_xy = (np.arange(n) * y).sum()
+    return (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+
+
+@njit(cache=True)
+def compute_indicators(close, volume):
+    """Latest SMA50, SMA200, RSI(14), MACD(12,26,9) and 20-bar volume mean of one symbol
+
+    EMAs are advanced in a single recursive pass and the SMAs only read their
+    trailing windows. Returns (sma50, sma200, rsi14, macd, signal, hist, vol20);
+    values needing more bars than available are NaN.
+    """
+    n = close.shape[0]
+    if n == 0:
+        return np.nan, np.nan, 50.0, np.nan, np.nan, np.nan, np.nan
+
+    # MACD line and its signal EMA, matching pandas ewm(adjust=False)
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+    ema12 = close[0]
+    ema26 = close[0]
+    signal = 0.0
+    for i in range(1, n):
+        ema12 = a12 * close[i] + (1.0 - a12) * ema12
+        ema26 = a26 * close[i] + (1.0 - a26) * ema26
+        signal = a9 * (ema12 - ema26) + (1.0 - a9) * signal
+    macd = ema12 - ema26
+
+    sma50 = close[n - 50:].mean() if n >= 50 else np.nan
+    sma200 = close[n - 200:].mean() if n >= 200 else np.nan
+    vol20 = volume[n - 20:].mean() if n >= 20 else np.nan
+    return sma50, sma200, rsi(close, 14)[-1], macd, signal, macd - signal, vol20
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def local_minima(values, window):
+        """Indices of bars strictly below every other bar within +/- window"""
+        n = values.shape[0]
+        out = np.empty(max(n - 2 * window, 0), dtype=np.int64)
+        count = 0
+        for i in range(window, n - window):
+            center = values[i]
+            is_minimum = True
+            for j in range(i - window, i + window + 1):
+                if j != i and not center < values[j]:
+                    is_minimum = False
+                    break
+            if is_minimum:
+                out[count] = i
+                count += 1
+        return out[:count]
+else:
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    def local_minima(values, window):
+        """Indices of bars strictly below every other bar within +/- window"""
+        if values.shape[0] < 2 * window + 1:
+            return np.empty(0, dtype=np.int64)
+        win = sliding_window_view(values, 2 * window + 1)
+        center = win[:, window]
+        is_min = (center < win[:, :window].min(axis=1)) & (center < win[:, window + 1:].min(axis=1))
+        return np.flatnonzero(is_min) + window
+
+
+def _within_bounds_loop(values, lows, highs):
+    """Rows whose every column j lies in [lows[j], highs[j]]; a NaN value never does"""
+    n, k = values.shape
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        ok = True
+        for j in range(k):
+            if not (lows[j] <= values[i, j] <= highs[j]):
+                ok = False
+                break
+        out[i] = ok
+    return out
+
+
+def _within_bounds_numpy(values, lows, highs):
+    """Rows whose every column j lies in [lows[j], highs[j]]; a NaN value never does"""
+    return ((lows <= values) & (values <= highs)).all(axis=1)
+
+
+# Compiled loop with numba, one broadcast compare without it; both are kept
+# importable so their results can be checked against each other
+if NUMBA_AVAILABLE:
+    within_bounds = njit(cache=True, parallel=True)(_within_bounds_loop)
+else:
+    within_bounds = _within_bounds_numpy
+
+
+# Panel kernels: rows are symbols, columns are bars. Rows are right-aligned and
+# NaN-padded on the left; starts[r] is the first valid column of row r.
+
+@njit(cache=True, parallel=True)
+def ema_2d(values, starts, span):
+    """Row-wise EMA over a symbol x bar panel"""
+    out = np.full(values.shape, np.nan)
+    for r in prange(values.shape[0]):
+        out[r, starts[r]:] = ema(values[r, starts[r]:], span)
+    return out
+
+
+@njit(cache=True)
+def bb_squeeze(close, period, std_dev, squeeze_days, percentile):
+    """Latest upper Bollinger band and squeeze flag (1.0/0.0; NaN without enough history)
+
+    The squeeze holds when the latest band width is within the lowest `percentile`
+    of band widths over the last `squeeze_days` bars.
+    """
+    n = close.shape[0]
+    if period < 2 or n < period * squeeze_days:
+        return np.nan, np.nan
+    widths = np.empty(squeeze_days)
+    upper = np.nan
+    for k in range(squeeze_days):
+        end = n - squeeze_days + k + 1
+        window = close[end - period:end]
+        mean = window.mean()
+        std = np.sqrt(((window - mean) ** 2).sum() / (period - 1))
+        widths[k] = 2.0 * std_dev * std / mean * 100.0
+        upper = mean + std * std_dev
+    threshold = np.quantile(widths, percentile / 100.0)
+    return upper, 1.0 if widths[-1] <= threshold else 0.0
+
+
+# Columns of the scan_array output, in order
+SCAN_FIELDS = ('rsi', 'vwap', 'obv', 'bb_upper', 'bb_squeeze')
+_N_SCAN_FIELDS = len(SCAN_FIELDS)
+
+
+@njit(cache=True, parallel=True)
+def scan_array(high, low, close, volume, starts, params):
+    """Latest-bar indicator snapshot for every symbol of a panel in one parallel pass
+
+    params holds (rsi_period, vwap_period, bb_period, bb_std_dev, squeeze_days,
+    squeeze_percentile); output columns follow SCAN_FIELDS.
+    """
+    rsi_period = int(params[0])
+    vwap_period = int(params[1])
+    bb_period = int(params[2])
+    bb_std_dev = params[3]
+    squeeze_days = int(params[4])
+    squeeze_percentile = params[5]
+
+    out = np.full((close.shape[0], _N_SCAN_FIELDS), np.nan)
+    for r in prange(close.shape[0]):
+        s = starts[r]
+        c = close[r, s:]
+        if c.shape[0] == 0:
+            continue
+        v = volume[r, s:]
+        out[r, 0] = rsi(c, rsi_period)[-1]
+        out[r, 1] = vwap(high[r, s:], low[r, s:], c, v, vwap_period)[-1]
+        out[r, 2] = obv(c, v)[-1]
+        upper, squeeze = bb_squeeze(c, bb_period, bb_std_dev, squeeze_days, squeeze_percentile)
+        out[r, 3] = upper
+        out[r, 4] = squeeze
+    return out
+
+
+def _warmup():
+    """Pay the JIT compile cost once at import instead of on the first symbol"""
+    dummy = np.linspace(1.0, 2.0, 100)
+    rsi(dummy, 14)
+    obv(dummy, dummy)
+    vwap(dummy, dummy, dummy, dummy, 20)
+    ema(dummy, 20)
+    sma(dummy, 20)
+    trend_slope(dummy)
+    compute_indicators(dummy, dummy)
+    local_minima(dummy, 3)
+    within_bounds(dummy.reshape(50, 2), np.zeros(2), np.full(2, 1.5))
+    panel = dummy.reshape(2, 50)
+    starts = np.zeros(2, dtype=np.int64)
+    ema_2d(panel, starts, 20)
+    bb_squeeze(dummy, 20, 2.0, 5, 10.0)
+    scan_array(panel, panel, panel, panel, starts, np.array([14.0, 20.0, 20.0, 2.0, 2.0, 10.0]))
+
+
+if NUMBA_AVAILABLE:
+    _warmup()
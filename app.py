@@ -5,10 +5,14 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import time
 import asyncio
+import logging
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-from bist_analyzer import BISTVolumeAnalyzer
+from bist_analyzer import BISTVolumeAnalyzer, pattern_mask
+
+# Per-symbol scan details are logged at DEBUG; only warnings reach the console
+logging.basicConfig(level=logging.WARNING)
 
 def get_market_status():
     """Piyasa durumunu kontrol et"""
@@ -1523,6 +1527,19 @@ def technical_analysis_section():
         """)
 
 
+# Pattern blocks each scan type reads; the analyzer skips the rest
+SCAN_PATTERN_BLOCKS = {
+    "ema_golden_cross": ('ema',),
+    "macd_zero_breakout": ('macd', 'sideways'),
+    "vwap_support_test": ('vwap',),
+    "triple_volume_confirmation": ('triple',),
+    "triangle_breakout": ('triangle',),
+    "rsi_divergence_breakout": ('divergence',),
+    "bollinger_squeeze_breakout": ('bb',),
+    "fibonacci_harmonic_pattern": ('fib',),
+}
+
+
 def apply_scan_criteria(analysis, volume_ratio, volume_progression,
                         min_volume_multiplier, scan_type, stock, **kwargs):
     """Apply different scanning criteria based on scan type"""
@@ -2044,6 +2061,8 @@ def run_analysis(analyzer,
         # Analyze stocks
         results = []
         total_stocks = len(bist_stocks)
+        patterns = pattern_mask(
+            SCAN_PATTERN_BLOCKS.get(scan_type, ('progression',)))
 
         for i, stock in enumerate(bist_stocks):
             try:
@@ -2060,6 +2079,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         ema_short=kwargs.get('ema_short', 50),
                         ema_long=kwargs.get('ema_long', 200),
                         volume_period=kwargs.get('volume_period', 20))
@@ -2069,6 +2089,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         macd_fast=kwargs.get('macd_fast', 12),
                         macd_slow=kwargs.get('macd_slow', 26),
                         macd_signal=kwargs.get('macd_signal', 9),
@@ -2081,6 +2102,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         vwap_period=kwargs.get('vwap_period', 20),
                         support_tolerance=kwargs.get('support_tolerance', 1.0),
                         bottom_lookback=kwargs.get('bottom_lookback', 10))
@@ -2090,6 +2112,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         volume_avg_period=kwargs.get('volume_avg_period', 20),
                         volume_multiplier_triple=kwargs.get(
                             'volume_multiplier_triple', 2.0),
@@ -2104,6 +2127,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         triangle_period=kwargs.get('triangle_period', 20),
                         convergence_threshold=kwargs.get(
                             'convergence_threshold', 3.0),
@@ -2121,6 +2145,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         rsi_period=kwargs.get('rsi_period', 14),
                         divergence_period=kwargs.get('divergence_period', 20),
                         min_divergence_strength=kwargs.get(
@@ -2138,6 +2163,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         bb_period=kwargs.get('bb_period', 20),
                         bb_std_dev=kwargs.get('bb_std_dev', 2.0),
                         squeeze_period=kwargs.get('squeeze_period', 6),
@@ -2154,6 +2180,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         fib_lookback_period=kwargs.get('fib_lookback_period',
                                                        50),
                         fib_retracement_min=kwargs.get('fib_retracement_min',
@@ -2177,6 +2204,7 @@ def run_analysis(analyzer,
                         period=period,
                         interval=interval,
                         sma_period=sma_period,
+                        patterns=patterns,
                         periods_to_check=kwargs.get('periods_to_check', 3))
 
                 if analysis and analysis['current_volume'] > 0:
@@ -2574,11 +2602,11 @@ def fundamental_analysis_section():
                 st.metric("Fiyat", f"{res['price']:.2f} ₺")
 
             st.markdown("### 🧮 Temel Analiz Kırılımı")
-            fdf = pd.DataFrame(res['fundamental_breakdown'])
+            fdf = pd.DataFrame([row.to_dict() for row in res['fundamental_breakdown']])
             st.dataframe(fdf, hide_index=True)
 
             st.markdown("### 📈 Teknik Analiz Kırılımı")
-            tdf = pd.DataFrame(res['technical_breakdown'])
+            tdf = pd.DataFrame([row.to_dict() for row in res['technical_breakdown']])
             st.dataframe(tdf, hide_index=True)
 
     st.markdown("---")
@@ -1,11 +1,512 @@
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime, timedelta
-from data_fetcher import TradingViewDataFetcher
+from dataclasses import dataclass
+from data_fetcher import TradingViewDataFetcher, to_yf_symbol
+import _indicators
+import os
+import json
+import pickle
 import time
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from bs4 import BeautifulSoup, SoupStrainer
 import re
+import functools
+import logging
+import threading
+
+try:
+    # Optional: lexbor-backed parser is much faster than BeautifulSoup for the components scrape
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Optional: faster JSON decoding for the scanner payload
+    import orjson
+except ImportError:
+    orjson = None
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Precompiled patterns used in the ticker fetch/merge loops
+_TICKER_RE = re.compile(r'[A-Z0-9]{1,6}')
+_TICKER_OVERRIDE_RE = re.compile(r'[A-Z0-9]{2,6}')
+_HREF_BIST_RE = re.compile(r'/symbols/BIST-')
+_BIST_SYMBOL_RE = re.compile(r'/symbols/BIST-([A-Z0-9]+)/')
+
+# On-disk cache for the fetched BIST universe (it changes rarely)
+_TICKER_CACHE_FILE = '.bist_tickers_cache.json'
+_TICKER_CACHE_TTL = 24 * 3600  # seconds
+
+# On-disk cache for yfinance info and annual statements (they update quarterly at most)
+_FUNDAMENTALS_CACHE_DIR = '.bist_fundamentals_cache'
+_FUNDAMENTALS_CACHE_TTL = 24 * 3600  # seconds
+
+# Comprehensive manually curated list of major BIST stocks, deduplicated and sorted once at import.
+# Problematic stocks that are delisted or have data issues are excluded.
+_COMPREHENSIVE_BIST_STOCKS = tuple(sorted(set([
+    # Major banks and financial institutions
+    'AKBNK', 'GARAN', 'ISCTR', 'HALKB', 'VAKBN', 'YKBNK', 'QNBFB', 'QNBFL',
+    'TSKB', 'ICBCT', 'ALBRK', 'SKBNK', 'KLNMA', 'ZIRAA', 'ISBTR', 'ISATR',
+    
+    # Major holdings and conglomerates  
+    'KCHOL', 'SAHOL', 'DOHOL', 'GUBRF', 'TAVHL', 'YGGYO', 'DGGYO',
+    
+    # Technology and telecommunications
+    'ASELS', 'TCELL', 'TTKOM', 'NETAS', 'LOGO', 'ARMDA', 'KREA', 'INDES',
+    'LINK', 'FONET', 'ARENA', 'KAREL', 'DESPC', 'SMART', 'EDATA',
+    
+    # Airlines and transportation
+    'THYAO', 'PGSUS', 'RYSAS', 'CLEBI', 'DOCO', 'GSDDE',
+    
+    # Automotive
+    'FROTO', 'TOASO', 'OTKAR', 'FORD', 'ASUZU', 'KATMR', 'KLMSN',
+    
+    # Energy and utilities
+    'TUPRS', 'EREGL', 'PETUN', 'GEREL', 'AKSEN', 'ZOREN', 'AYEN',
+    'CWENE', 'ENKAI', 'EPLAS', 'FENER', 'GWIND', 'HUNER', 'ISSEN',
+    'KAYSE', 'ODINE', 'POLTK', 'SMART', 'SOKE', 'TERNA', 'YESIL',
+    
+    # Retail and consumer goods
+    'BIMAS', 'MGROS', 'SOKM', 'CARRF', 'BIZIM', 'ADESE', 'MAVI',
+    'ULKER', 'CCOLA', 'ULUSE', 'AEFES', 'KENT', 'PETUN', 'PNSUT',
+    
+    # Construction and real estate
+    'ENKAI', 'AKFEN', 'ALTIN', 'DGGYO', 'EKGYO', 'EMLAK', 'GARAN',
+    'ISGYO', 'KLGYO', 'KOSGB', 'KRGYO', 'MSGYO', 'NUGYO', 'OZGYO',
+    'PAGYO', 'PEGYO', 'REIT', 'RNPOL', 'TRGYO', 'VCGYO', 'YATAS',
+    
+    # Industrial and manufacturing
+    'SISE', 'ARCLK', 'VESBE', 'CIMSA', 'OYAKC', 'TRKCM', 'AKSA',
+    'ALKIM', 'ANACM', 'AYGAZ', 'BRISA', 'BRYAT', 'BURCE', 'BURVA',
+    'CELHA', 'CMENT', 'CUSAN', 'DEVA', 'DGKLB', 'DYOBY', 'EGEEN',
+    'EGGUB', 'EMKEL', 'ERBOS', 'ERSU', 'FMIZP', 'GOODY', 'GUBRF',
+    'HEKTS', 'IHEVA', 'IZMDC', 'JANTS', 'KAPLM', 'KARTN', 'KCAER',
+    'KENT', 'KLSER', 'KONYA', 'KORDS', 'KRTEK', 'KUTPO', 'LUKSK',
+    'MAVI', 'MERKO', 'METRO', 'MPARK', 'NTHOL', 'PARSN', 'PETKM',
+    'PRKAB', 'ROYAL', 'SARKY', 'SELEC', 'TMPOL', 'TURSG', 'USAK',
+    'YATAS', 'ZOREN',
+    
+    # Steel and metals
+    'EREGL', 'KRDMD', 'CEMTS', 'DOKTA', 'ISDMR', 'OZBAL', 'SARKY',
+    
+    # Chemicals and petrochemicals  
+    'SASA', 'AKSA', 'ALKIM', 'ANACM', 'BAGFS', 'BRSAN', 'DYOBY',
+    'GUBRF', 'HEKTS', 'IHEVA', 'PETKM', 'RTALB', 'SODA', 'TUPRS',
+    
+    # Food and beverages
+    'ULKER', 'CCOLA', 'AEFES', 'BANVT', 'ERSU', 'KENT', 'KNFRT',
+    'KRSAN', 'MERKO', 'OYLUM', 'PENGD', 'PETUN', 'PINSU', 'PNSUT',
+    'TATGD', 'TUKAS', 'ULUSE', 'VANGD',
+    
+    # Textiles and apparel
+    'ARSAN', 'ATEKS', 'BLCYT', 'BRKO', 'DERIM', 'DIRIT', 'HATEK',
+    'KRTEK', 'LUKSK', 'MAVI', 'MENDERES', 'ROYAL', 'SKTAS', 'SNPAM',
+    'SODSN', 'YATAS', 'YUNSA',
+    
+    # Healthcare and pharmaceuticals
+    'DEVA', 'SELGD', 'SNGYO', 'ECZYT', 'LKMNH', 'EGPRO',
+    
+    # Paper and packaging
+    'KARTN', 'OLMIP', 'PRKAB', 'SILVR',
+    
+    # Tourism and leisure
+    'MAALT', 'PKART', 'TEKTU', 'UTPYA', 'AYCES', 'AVTUR', 'METUR',
+    'NTTUR', 'PKENT', 'TAKS', 'KSTUR', 'MARTI',
+    
+    # Media and entertainment
+    'DMRGD', 'HURGZ', 'IHLAS', 'IHLGM', 'IHYAY', 'KERVT', 'KLRHO',
+    'MEDTR', 'MRGYO', 'RAYSG', 'TMPOL', 'YGGYO',
+    
+    # Education
+    'FENER', 'BAHKM', 'OBASE',
+    
+    # Other sectors
+    'ADANA', 'ADEL', 'ADESE', 'ADBGR', 'AEFES', 'AFYON', 'AGESA',
+    'AGHOL', 'AGROT', 'AKARP', 'AKCNS', 'AKGRT', 'AKIN', 'AKSA',
+    'AKSEN', 'AKSGY', 'AKSUE', 'ALARK', 'ALBRK', 'ALCAR', 'ALCTL',
+    'ALFAS', 'ALGYO', 'ALKA', 'ALKIM', 'ALTIN', 'ALTNY', 'ALVES',
+    'ALYAG', 'ANELE', 'ANSGR', 'ARASE', 'ARCLK', 'ARDYZ', 'ARENA',
+    'ARMDA', 'ARSAN', 'ARTMS', 'ARZUM', 'ASELS', 'ASGYO', 'ASTOR',
+    'ASUZU', 'ATAGY', 'ATAKP', 'ATATP', 'ATEKS', 'ATLAS', 'ATSYH',
+    'AVGYO', 'AVHOL', 'AVISA', 'AVPGY', 'AVTUR', 'AYCEM', 'AYCES',
+    'AYEN', 'AYES', 'AYGAZ', 'AZTEK', 'BAGFS', 'BAHKM', 'BAKAB',
+    'BALAT', 'BANVT', 'BARMA', 'BASCM', 'BASGZ', 'BAYRK', 'BEGYO',
+    'BERA', 'BEYAZ', 'BFREN', 'BIGCH', 'BIMAS', 'BINBN', 'BIOEN',
+    'BIZIM', 'BJKAS', 'BLCYT', 'BMSCH', 'BMSTL', 'BNTAS', 'BOBET',
+    'BORLS', 'BORSK', 'BOSSA', 'BRISA', 'BRKO', 'BRKSN', 'BRMEN',
+    'BRSAN', 'BRYAT', 'BSOKE', 'BTCIM', 'BUCIM', 'BURCE', 'BURVA',
+    'BVSAN', 'BYDNR', 'CANTE', 'CARRF', 'CATES', 'CCOLA', 'CELHA',
+    'CEMTS', 'CEOEM', 'CIMSA', 'CLEBI', 'CMBTN', 'CMENT', 'CONSE',
+    'COSMO', 'CRDFA', 'CRFSA', 'CUSAN', 'CVKMD', 'CWENE', 'DAGI',
+    'DAPGM', 'DARDL', 'DENGE', 'DERHL', 'DERIM', 'DESPC', 'DEVA',
+    'DGATE', 'DGGYO', 'DGKLB', 'DIRIT', 'DMRGD', 'DMSAS', 'DNISI',
+    'DOAS', 'DOBUR', 'DOCO', 'DOGUB', 'DOHOL', 'DOKTA', 'DURDO',
+    'DYOBY', 'DZGYO', 'EDATA', 'EDIP', 'EGEEN', 'EGGUB', 'EGPRO',
+    'EGSER', 'EKGYO', 'EKIZ', 'EKSUN', 'ELITE', 'EMKEL', 'EMNIS',
+    'ENERY', 'ENJSA', 'ENKAI', 'ENSRI', 'EPLAS', 'ERBOS', 'ERCB',
+    'EREGL', 'ERSU', 'ESCAR', 'ESCOM', 'ETILR', 'ETYAT', 'EUKYO',
+    'EUREN', 'EUSDR', 'EUYAV', 'EYODER', 'FENER', 'FLAP', 'FMIZP',
+    'FONET', 'FORMT', 'FORTE', 'FROTO', 'FRIGO', 'GARAN', 'GARFA',
+    'GDKMD', 'GEDIK', 'GEDZA', 'GENIL', 'GEREL', 'GESAN', 'GIPTA',
+    'GLBMD', 'GLYHO', 'GMTAS', 'GOKNR', 'GOLTS', 'GOODY', 'GOZDE',
+    'GRNYO', 'GRSEL', 'GSDDE', 'GSDHO', 'GSRAY', 'GUBRF', 'GWIND',
+    'GZNMI', 'HALKB', 'HATEK', 'HATSN', 'HDFGS', 'HEDEF', 'HEKTS',
+    'HKTM', 'HLGYO', 'HOROZ', 'HRGYO', 'HTTBT', 'HUBVC', 'HURGZ',
+    'HUNER', 'IDAS', 'IDGYO', 'IHEVA', 'IHGZT', 'IHLAS', 'IHLGM',
+    'IHYAY', 'IMASM', 'INDES', 'INFO', 'INTEM', 'INVEO', 'INVES',
+    'ISGSY', 'ISGYO', 'ISKPL', 'ISSEN', 'IZENR', 'IZMDC', 'JANTS',
+    'KAPLM', 'KAREL', 'KARSN', 'KARTN', 'KATMR', 'KAYSE', 'KCAER',
+    'KCHOL', 'KENT', 'KERVT', 'KGYO', 'KIMMR', 'KLGYO', 'KLKIM',
+    'KLNMA', 'KLRHO', 'KLSER', 'KLSYN', 'KMPUR', 'KNFRT', 'KONYA',
+    'KOPOL', 'KORDS', 'KOSGB', 'KOZAA', 'KOZAL', 'KRDMA', 'KRDMB',
+    'KRDMD', 'KREA', 'KRPLS', 'KRSAN', 'KRTEK', 'KRVGD', 'KSTUR',
+    'KUTPO', 'LIDER', 'LINK', 'LKMNH', 'LOGO', 'LUKSK', 'MAALT',
+    'MACKO', 'MAGEN', 'MAKIM', 'MAKTK', 'MANAS', 'MARDIN', 'MARTI',
+    'MAVI', 'MEDTR', 'MEGAP', 'MEKAG', 'MEPET', 'MERCN', 'MERKO',
+    'METRO', 'METUR', 'MGROS', 'MHRGY', 'MILPA', 'MMCAS', 'MOBTL',
+    'MPARK', 'MRGYO', 'MRSHL', 'MSGYO', 'MTRKS', 'MTRYO', 'MULTD',
+    'NATEN', 'NBFGN', 'NETAS', 'NTHOL', 'NTTUR', 'NUGYO', 'OBASE',
+    'ODAS', 'ODINE', 'OLMIP', 'ONCSM', 'ORCAY', 'ORGE', 'ORMA',
+    'OSMEN', 'OSTIM', 'OTKAR', 'OTTO', 'OYLUM', 'OZBAL', 'OZGYO',
+    'OZKGY', 'OZRDN', 'OZSUB', 'PAGYO', 'PAMEL', 'PAPIL', 'PARSN',
+    'PASEU', 'PATEK', 'PCILT', 'PEGYO', 'PENGD', 'PENTA', 'PETKM',
+    'PETUN', 'PGSUS', 'PINSU', 'PKART', 'PKENT', 'PLAST', 'PLTUR',
+    'PNSUT', 'POLHO', 'POLTK', 'PRDGS', 'PRKAB', 'PRKME', 'PRZMA',
+    'PSDTC', 'QNBFB', 'QNBFL', 'QUAGR', 'RAYSG', 'REEDR', 'REIT',
+    'REYSN', 'RNPOL', 'RODRG', 'ROYAL', 'RTALB', 'RUBNS', 'RYSAS',
+    'SAFKR', 'SAHOL', 'SAMAT', 'SANEL', 'SANFM', 'SANKO', 'SARKY',
+    'SASA', 'SAYAS', 'SDTTR', 'SEGYO', 'SEKFK', 'SELEC', 'SELGD',
+    'SELVA', 'SEYKM', 'SILVR', 'SISE', 'SKBNK', 'SKTAS', 'SKYMD',
+    'SMART', 'SMRTG', 'SNKRN', 'SNPAM', 'SODA', 'SODSN', 'SOKE',
+    'SOKM', 'SONME', 'SRVGY', 'SUWEN', 'TATGD', 'TAVHL', 'TBORG',
+    'TCELL', 'TCKRC', 'TDGYO', 'TEKTU', 'TERA', 'TERNA', 'TETMT',
+    'TEZOL', 'THYAO', 'TIRE', 'TKFEN', 'TKNSA', 'TLMAN', 'TMPOL',
+    'TMSN', 'TOASO', 'TRCAS', 'TRGYO', 'TRILC', 'TSGYO', 'TSKB',
+    'TTKOM', 'TTRAK', 'TUCLK', 'TUKAS', 'TUPRS', 'TUREX', 'TURGG',
+    'TURSG', 'UFUK', 'ULAS', 'ULKER', 'ULUSE', 'ULUUN', 'UNLU',
+    'USAK', 'UTPYA', 'VAKBN', 'VAKFN', 'VANGD', 'VBTYZ', 'VCGYO',
+    'VEBET', 'VEHBI', 'VESBE', 'VESTL', 'VKGYO', 'VKMDM', 'VRGYO',
+    'WAVED', 'YAPRK', 'YATAS', 'YAYLA', 'YBTAS', 'YESIL', 'YGGYO',
+    'YGYO', 'YKBNK', 'YUNSA', 'YYLGD', 'ZEDUR', 'ZOREN', 'ZRGYO'
+]) - {'ZIRAAT', 'KOZA', 'SODA'}))
+
+
+class _RateLimitFilter(logging.Filter):
+    """Drop repeats of the same log message template within `interval` seconds"""
+    
+    def __init__(self, interval=5.0):
+        super().__init__()
+        self.interval = interval
+        self._last_seen = {}
+    
+    def filter(self, record):
+        now = time.monotonic()
+        last = self._last_seen.get(record.msg)
+        if last is not None and now - last < self.interval:
+            return False
+        self._last_seen[record.msg] = now
+        return True
+
+
+class _DictAccess:
+    """Read-only dict-style access to a dataclass's fields, for callers written against dict results"""
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return key in self.__dataclass_fields__
+    
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__dataclass_fields__ else default
+    
+    def keys(self):
+        return self.__dataclass_fields__.keys()
+    
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__dataclass_fields__}
+
+
+@dataclass(slots=True)
+class AnalysisResult(_DictAccess):
+    """Per-symbol result of analyze_stock_volume; also readable like the dict it replaces"""
+    symbol: str
+    current_volume: float
+    volume_sma: float
+    volume_ma: float
+    current_price: float
+    volume_trend: str
+    volume_ratio: float
+    volume_progression_check: bool
+    ema_short: float
+    ema_long: float
+    golden_cross: bool
+    golden_cross_recent: bool
+    macd_line: float
+    macd_histogram: float
+    macd_zero_breakout: bool
+    macd_zero_breakout_recent: bool
+    macd_histogram_positive: bool
+    sideways_movement: bool
+    vwap: float
+    vwap_support_test: bool
+    vwap_breakout_recent: bool
+    rising_bottoms: bool
+    rsi: float
+    obv: float
+    triple_volume_confirmed: bool
+    rsi_in_range: bool
+    obv_at_peak: bool
+    triangle_detected: bool
+    volume_declined: bool
+    breakout_confirmed: bool
+    breakout_direction_correct: bool
+    rsi_divergence_detected: bool
+    rsi_oversold: bool
+    resistance_broken: bool
+    volume_confirmed_breakout: bool
+    bb_squeeze_detected: bool
+    upper_band_broken: bool
+    volume_confirmed_squeeze: bool
+    consecutive_upper_closes: bool
+    fib_retracement_detected: bool
+    harmonic_pattern_detected: bool
+    fib_support_confirmed: bool
+    volume_confirmed_fib: bool
+    data_points: int
+    last_update: datetime
+
+
+
+@dataclass(slots=True)
+class ScoreRow:
+    """One criterion of an analyze_single_stock score breakdown"""
+    criterion: str
+    value: object
+    points: int
+    
+    def to_dict(self):
+        """Row with the Turkish column names shown in the UI"""
+        return {'Kriter': self.criterion, 'Değer': self.value, 'Puan': self.points}
+
+
+@dataclass(slots=True)
+class StockScore(_DictAccess):
+    """Result of analyze_single_stock; also readable like the dict it replaces"""
+    symbol: str
+    fundamental_points: int
+    technical_points: int
+    total_points: int
+    recommendation: str
+    fundamental_breakdown: list
+    technical_breakdown: list
+    price: float
+    # Useful fields for batch display
+    pe_ratio: float
+    pb_ratio: float
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringThresholds:
+    """analyze_single_stock scoring thresholds; the UI passes them as a partial dict"""
+    pe_excellent: float = 8.0
+    pe_good: float = 15.0
+    pb_excellent: float = 1.0
+    pb_good: float = 2.0
+    roe_excellent: float = 15.0
+    roe_good: float = 10.0
+    margin_excellent: float = 10.0
+    margin_good: float = 5.0
+    debt_excellent: float = 1.0
+    debt_good: float = 2.0
+    rsi_good_min: float = 40.0
+    rsi_good_max: float = 60.0
+    sma_tolerance: float = 2.0
+    volume_multiplier: float = 1.2
+    macd_tolerance: float = 0.01
+    
+    @classmethod
+    def from_params(cls, scoring_params):
+        """Fill the defaults in from a scoring_params dict (None or an instance pass through)"""
+        if isinstance(scoring_params, cls):
+            return scoring_params
+        if not scoring_params:
+            return cls()
+        return cls(**{name: scoring_params[name] for name in cls.__dataclass_fields__ if name in scoring_params})
+
+
+class _RateLimiter:
+    """Thread-safe limiter that spaces calls at least `interval` seconds apart"""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+logger = logging.getLogger(__name__)
+# analyze_stock_volume failures repeat per symbol during scans; only that handler is throttled
+_analysis_error_logger = logging.getLogger(f"{__name__}.analysis_errors")
+_analysis_error_logger.addFilter(_RateLimitFilter())
+
+
+# Pattern blocks of analyze_stock_volume; a block's bit in a pattern mask is its position here
+PATTERN_BLOCKS = ('progression', 'ema', 'macd', 'sideways', 'vwap', 'triple', 'triangle', 'divergence', 'bb', 'fib')
+ALL_PATTERNS = (1 << len(PATTERN_BLOCKS)) - 1
+
+
+def pattern_mask(names):
+    """Translate pattern block names into a bitmask for analyze_stock_volume"""
+    mask = 0
+    for name in names:
+        mask |= 1 << PATTERN_BLOCKS.index(name)
+    return mask
+
+
+@functools.lru_cache(maxsize=64)
+def _make_block_gate(mask):
+    """Build, once per mask, the gate that switches off pattern blocks outside the mask"""
+    if mask & ALL_PATTERNS == ALL_PATTERNS:
+        return lambda enabled: enabled
+    selected = frozenset(name for bit, name in enumerate(PATTERN_BLOCKS) if mask >> bit & 1)
+    
+    def gate(enabled):
+        return {name: ok and name in selected for name, ok in enabled.items()}
+    return gate
+
+
+# Harmonic pattern leg targets as (AB/XA, BC/AB, CD/BC, AD/XA), each leg with up to two
+# accepted ratios. NaN pads a single target; an all-NaN leg is not checked.
+_HARMONIC_PATTERNS = ('Gartley', 'Bat', 'Butterfly', 'Crab')
+_HARMONIC_TARGETS = np.array([
+    [[0.618, np.nan], [0.382, 0.886], [1.272, 1.618], [0.786, np.nan]],     # Gartley
+    [[0.382, 0.500], [np.nan, np.nan], [np.nan, np.nan], [0.886, np.nan]],  # Bat
+    [[0.786, np.nan], [np.nan, np.nan], [np.nan, np.nan], [1.272, 1.618]],  # Butterfly
+    [[0.382, 0.618], [np.nan, np.nan], [np.nan, np.nan], [1.618, np.nan]],  # Crab
+])
+_HARMONIC_FREE_LEGS = np.isnan(_HARMONIC_TARGETS).all(axis=-1)
+
+
+# Fundamental scoring criteria of analyze_single_stock, in breakdown order:
+# (label, lower_is_better, strict at excellent threshold, strict at good threshold)
+_FUNDAMENTAL_CRITERIA = (
+    ('F/K Oranı', True, False, False),
+    ('PD/DD Oranı', True, True, False),
+    ('FD/FAVÖK', True, True, False),
+    ('Net Kâr Marjı (%)', False, False, False),
+    ('Satış Büyümesi 3Y (%)', False, False, False),
+    ('Net Kâr Büyümesi 3Y (%)', False, False, True),
+    ('ROE (%)', False, False, False),
+    ('Borç/Özkaynak', True, True, False),
+    ('Cari Oran', False, False, False),
+    ('Faaliyet Nakit Akımı', False, False, False),
+)
+_FUNDAMENTAL_LABELS = tuple(label for label, _, _, _ in _FUNDAMENTAL_CRITERIA)
+# +1 turns "threshold - value" into "how far below", -1 into "how far above"
+_FUNDAMENTAL_DIRECTIONS = np.array([1.0 if lower else -1.0 for _, lower, _, _ in _FUNDAMENTAL_CRITERIA])
+_FUNDAMENTAL_STRICT = np.array([[excellent, good] for _, _, excellent, good in _FUNDAMENTAL_CRITERIA])
+
+
+# Fundamental screening fields and the value a stock missing the field is screened with
+_FUNDAMENTAL_DEFAULTS = {
+    'market_cap_est': 0, 'pe_ratio': 100, 'pb_ratio': 100, 'roe': 0, 'debt_equity_ratio': 10,
+    'dividend_yield': 0, 'revenue_growth': -100, 'profit_margin': 0, 'avg_volume': 0,
+    'price_change_1m': 0, 'price_change_3m': 0, 'price_change_6m': 0,
+}
+
+
+def _fundamental_columns(rows):
+    """Columnar view of get_fundamental_data rows: screening field -> float array, one entry per row"""
+    return {name: np.array([row.get(name, default) for row in rows], dtype=np.float64)
+            for name, default in _FUNDAMENTAL_DEFAULTS.items()}
+
+
+# Fundamental scan criteria as (field, low, high) ranges per scan type; a bound is
+# either a constant or a (param name, default) pair looked up in the scan params
+_SCAN_BOUNDS = {
+    'low_pe': (('pe_ratio', ('min_pe', 0), ('max_pe', 15)),),
+    'high_roe': (('roe', ('min_roe', 15), ('max_roe', 100)),),
+    'low_pb': (('pb_ratio', ('min_pb', 0), ('max_pb', 2)),),
+    'dividend': (('dividend_yield', ('min_dividend', 3), ('max_dividend', 20)),),
+    'low_debt': (('debt_equity_ratio', ('min_debt_equity', 0), ('max_debt_equity', 1)),),
+    'revenue_growth': (('revenue_growth', ('min_revenue_growth', 10), ('max_revenue_growth', 50)),),
+    'profit_margin': (('profit_margin', ('min_profit_margin', 10), ('max_profit_margin', 40)),),
+    # All criteria for combined value screening
+    'combined_value': (
+        ('pe_ratio', -np.inf, ('max_pe', 15)),
+        ('pb_ratio', -np.inf, ('max_pb', 2)),
+        ('roe', ('min_roe', 15), np.inf),
+        ('debt_equity_ratio', -np.inf, ('max_debt_equity', 1)),
+    ),
+    'high_volume': (('avg_volume', ('min_volume', 1000000), np.inf),),
+    'momentum': (('price_change_1m', ('min_momentum', 10), np.inf),),
+    'value': (('pe_ratio', -np.inf, ('max_pe', 15)), ('pb_ratio', -np.inf, ('max_pb', 2))),
+    'growth': (('price_change_3m', 15, np.inf), ('price_change_6m', 25, np.inf)),
+}
+
+# Sort key and direction of fundamental scan results: a field name, or a function
+# of the columns for composite keys
+_SORT_SPEC = {
+    'low_pe': ('pe_ratio', True),
+    'high_roe': ('roe', False),
+    'low_pb': ('pb_ratio', True),
+    'dividend': ('dividend_yield', False),
+    'low_debt': ('debt_equity_ratio', True),
+    'revenue_growth': ('revenue_growth', False),
+    'profit_margin': ('profit_margin', False),
+    # Best overall value score (low P/E + low P/B + high ROE + low debt)
+    'combined_value': (lambda c: c['pe_ratio'] + c['pb_ratio'] - c['roe'] + c['debt_equity_ratio'], True),
+    'high_volume': ('avg_volume', False),
+    'momentum': ('price_change_1m', False),
+    'value': (lambda c: c['pe_ratio'] + c['pb_ratio'], True),
+    'growth': (lambda c: c['price_change_3m'] + c['price_change_6m'], False),
+}
+
+
+# Category tags that are never taken as tickers from an override file
+_TICKER_OVERRIDE_EXCLUDE = {"REIT", "CEF", "ETF", "WARRANT", "FON", "FUND"}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_override_cached(path, mtime):
+    """Parse an override ticker file; keyed on mtime so edits invalidate the cache"""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    tickers = set()
+    for line in lines:
+        s = (line or '').strip().upper()
+        if not s or s.startswith('#'):
+            continue
+        if s in _TICKER_OVERRIDE_EXCLUDE:
+            continue
+        if _TICKER_OVERRIDE_RE.fullmatch(s):
+            tickers.add(s)
+    return tuple(sorted(tickers))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_override_npy_cached(path, mtime):
+    """Load the ticker array tools/parse_tickers.py writes next to the override file"""
+    return tuple(sorted(set(np.load(path).tolist()) - _TICKER_OVERRIDE_EXCLUDE))
+
 
 class BISTVolumeAnalyzer:
     """BIST stocks volume-based technical analysis tool"""
@@ -13,116 +514,173 @@ class BISTVolumeAnalyzer:
     def __init__(self):
         self.data_fetcher = TradingViewDataFetcher()
         self.bist_stocks = []
+        # When bist_stocks was last resolved from the override file, disk cache or network
+        self._bist_stocks_at = None
+        # yfinance (Ticker, info) per symbol, so each symbol costs one .info round-trip
+        self._info_cache = {}
+        self._info_lock = threading.Lock()
+        # Shared keep-alive session for TradingView requests
+        self._session = requests.Session()
+        self._session.headers.update({'User-Agent': _USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+    def get_bist_stocks(self, force_refresh=False):
+        """Get comprehensive list of all BIST stocks from TradingView
+
+        Args:
+            force_refresh (bool): Ignore the on-disk ticker cache and refetch
+        """
+        # Reuse the list resolved earlier in this session while it is fresh
+        if (not force_refresh and self.bist_stocks and self._bist_stocks_at is not None
+                and time.monotonic() - self._bist_stocks_at < _TICKER_CACHE_TTL):
+            return self.bist_stocks
+        self._bist_stocks_at = None
         
-    def get_bist_stocks(self):
-        """Get comprehensive list of all BIST stocks from TradingView"""
         try:
             # 0) If override file exists and has tickers, prefer it
             override = self._load_override_tickers_file('bist_tickers.txt')
             if len(override) >= 50:
                 self.bist_stocks = override
+                self._bist_stocks_at = time.monotonic()
                 print(f"Using override tickers file with {len(override)} symbols")
                 return self.bist_stocks
 
-            # 1) Prefer TradingView scanner API (broader coverage)
-            scanner_list = self._fetch_bist_from_tradingview_scanner()
+            # Serve a fresh on-disk cache before hitting the network
+            if not force_refresh:
+                cached = self._load_cached_tickers(max_age=_TICKER_CACHE_TTL)
+                if cached:
+                    self.bist_stocks = cached
+                    self._bist_stocks_at = time.monotonic()
+                    print(f"Using cached BIST list with {len(cached)} tickers")
+                    return self.bist_stocks
 
+            # 1) Prefer TradingView scanner API (broader coverage)
             # 2) Also try components page as a secondary source
-            components_list = self._fetch_bist_all_shares_from_tradingview()
-
-            # 3) Manual comprehensive list as fallback
-            manual_list = self._get_comprehensive_bist_stocks()
+            # Both are network-bound, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                scanner_future = executor.submit(self._fetch_bist_from_tradingview_scanner)
+                components_future = executor.submit(self._fetch_bist_all_shares_from_tradingview)
+                scanner_set = scanner_future.result()
+                components_set = components_future.result()
 
-            # Merge and deduplicate, prefer scanner list if sufficiently large
-            merged = set()
-            for src in (scanner_list, components_list, manual_list):
-                for s in src:
-                    if isinstance(s, str):
-                        s2 = s.strip().upper()
-                        if re.fullmatch(r'[A-Z0-9]{1,6}', s2):
-                            merged.add(s2)
+            # Both sources failed (likely offline): a stale cache beats the manual list
+            if not scanner_set and not components_set:
+                stale = self._load_cached_tickers()
+                if stale:
+                    self.bist_stocks = stale
+                    print(f"TradingView unreachable, using stale cached BIST list ({len(stale)} tickers)")
+                    return self.bist_stocks
 
-            merged_list = sorted(list(merged))
+            # 3) Manual comprehensive list as fallback
+            manual_set = frozenset(s for s in self._get_comprehensive_bist_stocks() if _TICKER_RE.fullmatch(s))
 
+            # Fetchers already return validated uppercase tickers, so merging is a plain union
             # If scanner returned a robust list (e.g., > 550), trust it; else use merged
-            final_list = scanner_list if len(scanner_list) >= 550 else merged_list
+            if len(scanner_set) >= 550:
+                final_list = sorted(scanner_set)
+            else:
+                final_list = sorted(scanner_set | components_set | manual_set)
 
             self.bist_stocks = final_list
             print(f"BIST list finalized with {len(final_list)} tickers")
+            # Only keep and cache lists backed by TradingView, so an outage is retried later
+            if scanner_set or components_set:
+                self._bist_stocks_at = time.monotonic()
+                self._save_cached_tickers(final_list)
             return self.bist_stocks
                 
         except Exception as e:
             print(f"Error fetching BIST stocks: {e}")
+            stale = self._load_cached_tickers()
+            if stale:
+                self.bist_stocks = stale
+                return self.bist_stocks
             # Use comprehensive manual list as fallback
             return self._get_comprehensive_bist_stocks()
 
+    def _load_cached_tickers(self, path=_TICKER_CACHE_FILE, max_age=None):
+        """Load tickers from the on-disk cache; None if missing, unreadable or older than max_age seconds."""
+        try:
+            if not os.path.exists(path):
+                return None
+            if max_age is not None and time.time() - os.path.getmtime(path) >= max_age:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            tickers = payload.get('tickers') or []
+            return list(tickers) if tickers else None
+        except Exception as e:
+            print(f"Error reading ticker cache: {e}")
+            return None
+
+    def _save_cached_tickers(self, tickers, path=_TICKER_CACHE_FILE):
+        """Persist tickers to the on-disk cache"""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': time.time(), 'tickers': list(tickers)}, f)
+        except Exception as e:
+            print(f"Error writing ticker cache: {e}")
+
     def _load_override_tickers_file(self, path='bist_tickers.txt'):
         """Load ticker symbols from a plain text file (one per line)."""
         try:
-            import os
             if not os.path.exists(path):
                 return []
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = f.read().splitlines()
-            tickers = []
-            EXCLUDE = {"REIT", "CEF", "ETF", "WARRANT", "FON", "FUND"}
-            for line in lines:
-                s = (line or '').strip().upper()
-                if not s or s.startswith('#'):
-                    continue
-                if s in EXCLUDE:
-                    continue
-                if re.fullmatch(r'[A-Z0-9]{2,6}', s):
-                    tickers.append(s)
-            # unique and sorted
-            return sorted(list(set(tickers)))
+            mtime = os.path.getmtime(path)
+            # Prefer the binary copy unless the text file was edited after it was written
+            npy_path = os.path.splitext(path)[0] + '.npy'
+            if os.path.exists(npy_path) and os.path.getmtime(npy_path) >= mtime:
+                return list(_load_override_npy_cached(npy_path, os.path.getmtime(npy_path)))
+            return list(_load_override_cached(path, mtime))
         except Exception as e:
             print(f"Error loading override tickers: {e}")
             return []
     
     def _fetch_bist_all_shares_from_tradingview(self):
-        """Fetch all BIST stocks from TradingView XUTUM components"""
+        """Fetch all BIST stocks from TradingView XUTUM components as a frozenset of tickers"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
             url = "https://www.tradingview.com/symbols/BIST-XUTUM/components/"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Look for links with BIST- pattern
+            if LexborHTMLParser is not None:
+                tree = LexborHTMLParser(response.text)
+                hrefs = [node.attributes.get('href') for node in tree.css('a[href*="/symbols/BIST-"]')]
+            else:
+                # Only build anchors with BIST- links; the rest of the page is never materialized
+                strainer = SoupStrainer('a', href=_HREF_BIST_RE)
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=strainer)
+                hrefs = [link.get('href') for link in soup if hasattr(link, 'get')]
             
             # Find all stock symbols in the table
-            symbols = []
-            # Look for links with BIST- pattern
-            for link in soup.find_all('a', href=re.compile(r'/symbols/BIST-')):
-                href = link.get('href') if hasattr(link, 'get') else str(link.get('href', ''))
+            symbols = set()
+            for href in hrefs:
                 if href and isinstance(href, str):
-                    match = re.search(r'/symbols/BIST-([A-Z0-9]+)/', href)
+                    match = _BIST_SYMBOL_RE.search(href)
                     if match:
                         symbol = match.group(1)
                         # Filter out indices and other non-stock symbols
                         if len(symbol) <= 6 and symbol not in ['XUTUM', 'XU100', 'XU030', 'XUSIN', 'XUMAL']:
-                            symbols.append(symbol)
+                            symbols.add(symbol)
             
-            # Remove duplicates and sort
-            symbols = sorted(list(set(symbols)))
             print(f"Fetched {len(symbols)} stocks from TradingView")
             
-            return symbols
+            return frozenset(symbols)
             
         except Exception as e:
             print(f"Error fetching from TradingView: {e}")
-            return []
+            return frozenset()
 
     def _fetch_bist_from_tradingview_scanner(self):
-        """Fetch BIST stocks via TradingView scanner API (exchange=BIST, type=stock)."""
+        """Fetch BIST stocks via TradingView scanner API (exchange=BIST, type=stock) as a frozenset of tickers."""
         try:
             url = "https://scanner.tradingview.com/turkey/scan"
             headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
                 'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, deflate',
                 'Content-Type': 'application/json'
             }
             payload = {
@@ -134,186 +692,30 @@ class BISTVolumeAnalyzer:
                 "columns": ["symbol"],
                 "sort": {"sortBy": "name", "sortOrder": "asc"},
                 "options": {"lang": "tr"},
-                "range": [0, 1500]
+                "range": [0, 800]  # BIST lists ~600 stocks; keeps headroom without oversized payloads
             }
-            resp = requests.post(url, json=payload, headers=headers, timeout=12)
+            resp = self._session.post(url, json=payload, headers=headers, timeout=12)
             resp.raise_for_status()
-            data = resp.json()
-            out = []
+            data = orjson.loads(resp.content) if orjson is not None else resp.json()
+            out = set()
             for row in data.get('data', []):
                 s = row.get('s') or ''
                 # Expect format like 'BIST:THYAO'
                 parts = s.split(':')
                 if len(parts) == 2 and parts[0] == 'BIST':
                     sym = parts[1].strip().upper()
-                    if re.fullmatch(r'[A-Z0-9]{1,6}', sym):
-                        out.append(sym)
-            out = sorted(list(set(out)))
+                    if _TICKER_RE.fullmatch(sym):
+                        out.add(sym)
             print(f"Fetched {len(out)} stocks from TradingView scanner")
-            return out
+            return frozenset(out)
         except Exception as e:
             print(f"Error fetching from TradingView scanner: {e}")
-            return []
+            return frozenset()
     
     def _get_comprehensive_bist_stocks(self):
         """Get comprehensive manually curated list of BIST stocks"""
-        # Comprehensive list of major BIST stocks (588+ stocks)
-        comprehensive_stocks = [
-            # Major banks and financial institutions
-            'AKBNK', 'GARAN', 'ISCTR', 'HALKB', 'VAKBN', 'YKBNK', 'QNBFB', 'QNBFL',
-            'TSKB', 'ICBCT', 'ALBRK', 'SKBNK', 'KLNMA', 'ZIRAA', 'ISBTR', 'ISATR',
-            
-            # Major holdings and conglomerates  
-            'KCHOL', 'SAHOL', 'DOHOL', 'GUBRF', 'TAVHL', 'YGGYO', 'DGGYO',
-            
-            # Technology and telecommunications
-            'ASELS', 'TCELL', 'TTKOM', 'NETAS', 'LOGO', 'ARMDA', 'KREA', 'INDES',
-            'LINK', 'FONET', 'ARENA', 'KAREL', 'DESPC', 'SMART', 'EDATA',
-            
-            # Airlines and transportation
-            'THYAO', 'PGSUS', 'RYSAS', 'CLEBI', 'DOCO', 'GSDDE',
-            
-            # Automotive
-            'FROTO', 'TOASO', 'OTKAR', 'FORD', 'ASUZU', 'KATMR', 'KLMSN',
-            
-            # Energy and utilities
-            'TUPRS', 'EREGL', 'PETUN', 'GEREL', 'AKSEN', 'ZOREN', 'AYEN',
-            'CWENE', 'ENKAI', 'EPLAS', 'FENER', 'GWIND', 'HUNER', 'ISSEN',
-            'KAYSE', 'ODINE', 'POLTK', 'SMART', 'SOKE', 'TERNA', 'YESIL',
-            
-            # Retail and consumer goods
-            'BIMAS', 'MGROS', 'SOKM', 'CARRF', 'BIZIM', 'ADESE', 'MAVI',
-            'ULKER', 'CCOLA', 'ULUSE', 'AEFES', 'KENT', 'PETUN', 'PNSUT',
-            
-            # Construction and real estate
-            'ENKAI', 'AKFEN', 'ALTIN', 'DGGYO', 'EKGYO', 'EMLAK', 'GARAN',
-            'ISGYO', 'KLGYO', 'KOSGB', 'KRGYO', 'MSGYO', 'NUGYO', 'OZGYO',
-            'PAGYO', 'PEGYO', 'REIT', 'RNPOL', 'TRGYO', 'VCGYO', 'YATAS',
-            
-            # Industrial and manufacturing
-            'SISE', 'ARCLK', 'VESBE', 'CIMSA', 'OYAKC', 'TRKCM', 'AKSA',
-            'ALKIM', 'ANACM', 'AYGAZ', 'BRISA', 'BRYAT', 'BURCE', 'BURVA',
-            'CELHA', 'CMENT', 'CUSAN', 'DEVA', 'DGKLB', 'DYOBY', 'EGEEN',
-            'EGGUB', 'EMKEL', 'ERBOS', 'ERSU', 'FMIZP', 'GOODY', 'GUBRF',
-            'HEKTS', 'IHEVA', 'IZMDC', 'JANTS', 'KAPLM', 'KARTN', 'KCAER',
-            'KENT', 'KLSER', 'KONYA', 'KORDS', 'KRTEK', 'KUTPO', 'LUKSK',
-            'MAVI', 'MERKO', 'METRO', 'MPARK', 'NTHOL', 'PARSN', 'PETKM',
-            'PRKAB', 'ROYAL', 'SARKY', 'SELEC', 'TMPOL', 'TURSG', 'USAK',
-            'YATAS', 'ZOREN',
-            
-            # Steel and metals
-            'EREGL', 'KRDMD', 'CEMTS', 'DOKTA', 'ISDMR', 'OZBAL', 'SARKY',
-            
-            # Chemicals and petrochemicals  
-            'SASA', 'AKSA', 'ALKIM', 'ANACM', 'BAGFS', 'BRSAN', 'DYOBY',
-            'GUBRF', 'HEKTS', 'IHEVA', 'PETKM', 'RTALB', 'SODA', 'TUPRS',
-            
-            # Food and beverages
-            'ULKER', 'CCOLA', 'AEFES', 'BANVT', 'ERSU', 'KENT', 'KNFRT',
-            'KRSAN', 'MERKO', 'OYLUM', 'PENGD', 'PETUN', 'PINSU', 'PNSUT',
-            'TATGD', 'TUKAS', 'ULUSE', 'VANGD',
-            
-            # Textiles and apparel
-            'ARSAN', 'ATEKS', 'BLCYT', 'BRKO', 'DERIM', 'DIRIT', 'HATEK',
-            'KRTEK', 'LUKSK', 'MAVI', 'MENDERES', 'ROYAL', 'SKTAS', 'SNPAM',
-            'SODSN', 'YATAS', 'YUNSA',
-            
-            # Healthcare and pharmaceuticals
-            'DEVA', 'SELGD', 'SNGYO', 'ECZYT', 'LKMNH', 'EGPRO',
-            
-            # Paper and packaging
-            'KARTN', 'OLMIP', 'PRKAB', 'SILVR',
-            
-            # Tourism and leisure
-            'MAALT', 'PKART', 'TEKTU', 'UTPYA', 'AYCES', 'AVTUR', 'METUR',
-            'NTTUR', 'PKENT', 'TAKS', 'KSTUR', 'MARTI',
-            
-            # Media and entertainment
-            'DMRGD', 'HURGZ', 'IHLAS', 'IHLGM', 'IHYAY', 'KERVT', 'KLRHO',
-            'MEDTR', 'MRGYO', 'RAYSG', 'TMPOL', 'YGGYO',
-            
-            # Education
-            'FENER', 'BAHKM', 'OBASE',
-            
-            # Other sectors
-            'ADANA', 'ADEL', 'ADESE', 'ADBGR', 'AEFES', 'AFYON', 'AGESA',
-            'AGHOL', 'AGROT', 'AKARP', 'AKCNS', 'AKGRT', 'AKIN', 'AKSA',
-            'AKSEN', 'AKSGY', 'AKSUE', 'ALARK', 'ALBRK', 'ALCAR', 'ALCTL',
-            'ALFAS', 'ALGYO', 'ALKA', 'ALKIM', 'ALTIN', 'ALTNY', 'ALVES',
-            'ALYAG', 'ANELE', 'ANSGR', 'ARASE', 'ARCLK', 'ARDYZ', 'ARENA',
-            'ARMDA', 'ARSAN', 'ARTMS', 'ARZUM', 'ASELS', 'ASGYO', 'ASTOR',
-            'ASUZU', 'ATAGY', 'ATAKP', 'ATATP', 'ATEKS', 'ATLAS', 'ATSYH',
-            'AVGYO', 'AVHOL', 'AVISA', 'AVPGY', 'AVTUR', 'AYCEM', 'AYCES',
-            'AYEN', 'AYES', 'AYGAZ', 'AZTEK', 'BAGFS', 'BAHKM', 'BAKAB',
-            'BALAT', 'BANVT', 'BARMA', 'BASCM', 'BASGZ', 'BAYRK', 'BEGYO',
-            'BERA', 'BEYAZ', 'BFREN', 'BIGCH', 'BIMAS', 'BINBN', 'BIOEN',
-            'BIZIM', 'BJKAS', 'BLCYT', 'BMSCH', 'BMSTL', 'BNTAS', 'BOBET',
-            'BORLS', 'BORSK', 'BOSSA', 'BRISA', 'BRKO', 'BRKSN', 'BRMEN',
-            'BRSAN', 'BRYAT', 'BSOKE', 'BTCIM', 'BUCIM', 'BURCE', 'BURVA',
-            'BVSAN', 'BYDNR', 'CANTE', 'CARRF', 'CATES', 'CCOLA', 'CELHA',
-            'CEMTS', 'CEOEM', 'CIMSA', 'CLEBI', 'CMBTN', 'CMENT', 'CONSE',
-            'COSMO', 'CRDFA', 'CRFSA', 'CUSAN', 'CVKMD', 'CWENE', 'DAGI',
-            'DAPGM', 'DARDL', 'DENGE', 'DERHL', 'DERIM', 'DESPC', 'DEVA',
-            'DGATE', 'DGGYO', 'DGKLB', 'DIRIT', 'DMRGD', 'DMSAS', 'DNISI',
-            'DOAS', 'DOBUR', 'DOCO', 'DOGUB', 'DOHOL', 'DOKTA', 'DURDO',
-            'DYOBY', 'DZGYO', 'EDATA', 'EDIP', 'EGEEN', 'EGGUB', 'EGPRO',
-            'EGSER', 'EKGYO', 'EKIZ', 'EKSUN', 'ELITE', 'EMKEL', 'EMNIS',
-            'ENERY', 'ENJSA', 'ENKAI', 'ENSRI', 'EPLAS', 'ERBOS', 'ERCB',
-            'EREGL', 'ERSU', 'ESCAR', 'ESCOM', 'ETILR', 'ETYAT', 'EUKYO',
-            'EUREN', 'EUSDR', 'EUYAV', 'EYODER', 'FENER', 'FLAP', 'FMIZP',
-            'FONET', 'FORMT', 'FORTE', 'FROTO', 'FRIGO', 'GARAN', 'GARFA',
-            'GDKMD', 'GEDIK', 'GEDZA', 'GENIL', 'GEREL', 'GESAN', 'GIPTA',
-            'GLBMD', 'GLYHO', 'GMTAS', 'GOKNR', 'GOLTS', 'GOODY', 'GOZDE',
-            'GRNYO', 'GRSEL', 'GSDDE', 'GSDHO', 'GSRAY', 'GUBRF', 'GWIND',
-            'GZNMI', 'HALKB', 'HATEK', 'HATSN', 'HDFGS', 'HEDEF', 'HEKTS',
-            'HKTM', 'HLGYO', 'HOROZ', 'HRGYO', 'HTTBT', 'HUBVC', 'HURGZ',
-            'HUNER', 'IDAS', 'IDGYO', 'IHEVA', 'IHGZT', 'IHLAS', 'IHLGM',
-            'IHYAY', 'IMASM', 'INDES', 'INFO', 'INTEM', 'INVEO', 'INVES',
-            'ISGSY', 'ISGYO', 'ISKPL', 'ISSEN', 'IZENR', 'IZMDC', 'JANTS',
-            'KAPLM', 'KAREL', 'KARSN', 'KARTN', 'KATMR', 'KAYSE', 'KCAER',
-            'KCHOL', 'KENT', 'KERVT', 'KGYO', 'KIMMR', 'KLGYO', 'KLKIM',
-            'KLNMA', 'KLRHO', 'KLSER', 'KLSYN', 'KMPUR', 'KNFRT', 'KONYA',
-            'KOPOL', 'KORDS', 'KOSGB', 'KOZAA', 'KOZAL', 'KRDMA', 'KRDMB',
-            'KRDMD', 'KREA', 'KRPLS', 'KRSAN', 'KRTEK', 'KRVGD', 'KSTUR',
-            'KUTPO', 'LIDER', 'LINK', 'LKMNH', 'LOGO', 'LUKSK', 'MAALT',
-            'MACKO', 'MAGEN', 'MAKIM', 'MAKTK', 'MANAS', 'MARDIN', 'MARTI',
-            'MAVI', 'MEDTR', 'MEGAP', 'MEKAG', 'MEPET', 'MERCN', 'MERKO',
-            'METRO', 'METUR', 'MGROS', 'MHRGY', 'MILPA', 'MMCAS', 'MOBTL',
-            'MPARK', 'MRGYO', 'MRSHL', 'MSGYO', 'MTRKS', 'MTRYO', 'MULTD',
-            'NATEN', 'NBFGN', 'NETAS', 'NTHOL', 'NTTUR', 'NUGYO', 'OBASE',
-            'ODAS', 'ODINE', 'OLMIP', 'ONCSM', 'ORCAY', 'ORGE', 'ORMA',
-            'OSMEN', 'OSTIM', 'OTKAR', 'OTTO', 'OYLUM', 'OZBAL', 'OZGYO',
-            'OZKGY', 'OZRDN', 'OZSUB', 'PAGYO', 'PAMEL', 'PAPIL', 'PARSN',
-            'PASEU', 'PATEK', 'PCILT', 'PEGYO', 'PENGD', 'PENTA', 'PETKM',
-            'PETUN', 'PGSUS', 'PINSU', 'PKART', 'PKENT', 'PLAST', 'PLTUR',
-            'PNSUT', 'POLHO', 'POLTK', 'PRDGS', 'PRKAB', 'PRKME', 'PRZMA',
-            'PSDTC', 'QNBFB', 'QNBFL', 'QUAGR', 'RAYSG', 'REEDR', 'REIT',
-            'REYSN', 'RNPOL', 'RODRG', 'ROYAL', 'RTALB', 'RUBNS', 'RYSAS',
-            'SAFKR', 'SAHOL', 'SAMAT', 'SANEL', 'SANFM', 'SANKO', 'SARKY',
-            'SASA', 'SAYAS', 'SDTTR', 'SEGYO', 'SEKFK', 'SELEC', 'SELGD',
-            'SELVA', 'SEYKM', 'SILVR', 'SISE', 'SKBNK', 'SKTAS', 'SKYMD',
-            'SMART', 'SMRTG', 'SNKRN', 'SNPAM', 'SODA', 'SODSN', 'SOKE',
-            'SOKM', 'SONME', 'SRVGY', 'SUWEN', 'TATGD', 'TAVHL', 'TBORG',
-            'TCELL', 'TCKRC', 'TDGYO', 'TEKTU', 'TERA', 'TERNA', 'TETMT',
-            'TEZOL', 'THYAO', 'TIRE', 'TKFEN', 'TKNSA', 'TLMAN', 'TMPOL',
-            'TMSN', 'TOASO', 'TRCAS', 'TRGYO', 'TRILC', 'TSGYO', 'TSKB',
-            'TTKOM', 'TTRAK', 'TUCLK', 'TUKAS', 'TUPRS', 'TUREX', 'TURGG',
-            'TURSG', 'UFUK', 'ULAS', 'ULKER', 'ULUSE', 'ULUUN', 'UNLU',
-            'USAK', 'UTPYA', 'VAKBN', 'VAKFN', 'VANGD', 'VBTYZ', 'VCGYO',
-            'VEBET', 'VEHBI', 'VESBE', 'VESTL', 'VKGYO', 'VKMDM', 'VRGYO',
-            'WAVED', 'YAPRK', 'YATAS', 'YAYLA', 'YBTAS', 'YESIL', 'YGGYO',
-            'YGYO', 'YKBNK', 'YUNSA', 'YYLGD', 'ZEDUR', 'ZOREN', 'ZRGYO'
-        ]
-        
-        # Remove duplicates and sort
-        comprehensive_stocks = sorted(list(set(comprehensive_stocks)))
-        
-        # Remove problematic stocks that are delisted or have data issues
-        excluded_stocks = ['ZIRAAT', 'KOZA', 'SODA']
-        comprehensive_stocks = [stock for stock in comprehensive_stocks if stock not in excluded_stocks]
-        
-        self.bist_stocks = comprehensive_stocks
-        print(f"Using comprehensive list with {len(comprehensive_stocks)} BIST stocks")
+        self.bist_stocks = list(_COMPREHENSIVE_BIST_STOCKS)
+        print(f"Using comprehensive list with {len(self.bist_stocks)} BIST stocks")
         
         return self.bist_stocks
     
@@ -329,7 +731,8 @@ class BISTVolumeAnalyzer:
                            upper_band_breakout_percent=1.0, volume_squeeze_multiplier=1.5, consecutive_days=2,
                            fib_lookback_period=50, fib_retracement_min=38.2, fib_retracement_max=50.0,
                            fib_support_tolerance=2.0, harmonic_pattern_type="Otomatik", harmonic_tolerance=5.0,
-                           fib_volume_multiplier=1.3, trend_strength_days=10, periods_to_check=3):
+                           fib_volume_multiplier=1.3, trend_strength_days=10, periods_to_check=3,
+                           patterns=ALL_PATTERNS):
         """
         Analyze volume for a single stock
         
@@ -384,6 +787,7 @@ class BISTVolumeAnalyzer:
             fib_volume_multiplier (float): Volume multiplier for support test
             trend_strength_days (int): Days for trend strength analysis
             periods_to_check (int): Number of periods to check for volume progression (1-4)
+            patterns (int): Bitmask of pattern blocks to run (see pattern_mask); others stay False
             
         Returns:
             dict: Analysis results
@@ -395,115 +799,106 @@ class BISTVolumeAnalyzer:
             if data is None or len(data) < sma_period:
                 return None
             
-            # Calculate volume SMA
-            data['volume_sma'] = data['volume'].rolling(window=sma_period).mean()
-            
-            # Calculate EMAs for price
-            data['ema_short'] = data['close'].ewm(span=ema_short).mean()
-            data['ema_long'] = data['close'].ewm(span=ema_long).mean()
-            
-            # Calculate volume moving average for comparison
-            data['volume_ma'] = data['volume'].rolling(window=volume_period).mean()
-            
-            # Calculate MACD
-            data['macd_ema_fast'] = data['close'].ewm(span=macd_fast).mean()
-            data['macd_ema_slow'] = data['close'].ewm(span=macd_slow).mean()
-            data['macd_line'] = data['macd_ema_fast'] - data['macd_ema_slow']
-            data['macd_signal'] = data['macd_line'].ewm(span=macd_signal).mean()
-            data['macd_histogram'] = data['macd_line'] - data['macd_signal']
-            
-            # Calculate VWAP
-            data['vwap'] = self._calculate_vwap(data, vwap_period)
-            
-            # Calculate RSI
-            data['rsi'] = self._calculate_rsi(data['close'], rsi_period)
+            # Attach every indicator column in one pass
+            self._enrich(data, sma_period, volume_period, ema_short, ema_long,
+                         macd_fast, macd_slow, macd_signal, vwap_period, rsi_period)
+            
+            # Get latest values straight from the column arrays
+            (close_arr, high_arr, low_arr, volume_arr, volume_sma_arr, volume_ma_arr, ema_short_arr, ema_long_arr,
+             macd_arr, hist_arr, vwap_arr, rsi_arr, obv_arr) = (
+                data[c].to_numpy(dtype=np.float64)
+                for c in ('close', 'high', 'low', 'volume', 'volume_sma', 'volume_ma', 'ema_short',
+                          'ema_long', 'macd_line', 'macd_histogram', 'vwap', 'rsi', 'obv')
+            )
+            current_volume = volume_arr[-1]
+            volume_sma = volume_sma_arr[-1]
+            current_price = close_arr[-1]
+            ema_short_current = ema_short_arr[-1]
+            ema_long_current = ema_long_arr[-1]
+            volume_ma_current = volume_ma_arr[-1]
+            macd_line_current = macd_arr[-1]
+            macd_histogram_current = hist_arr[-1]
+            vwap_current = vwap_arr[-1]
+            rsi_current = rsi_arr[-1]
+            obv_current = obv_arr[-1]
+            
+            # Calculate required minimum data points for the volume progression check
+            required_periods = periods_to_check + 1  # Need one more data point for comparison
             
-            # Calculate OBV
-            data['obv'] = self._calculate_obv(data)
+            # Validate data once up front; the helpers below assume finite inputs
+            if pd.isna(current_volume) or pd.isna(volume_sma) or volume_sma == 0:
+                return None
+            if not all(np.isfinite(arr).all() for arr in (close_arr, high_arr, low_arr, volume_arr)):
+                return None
             
-            # Get latest values
-            latest_data = data.iloc[-1]
-            current_volume = latest_data['volume']
-            volume_sma = latest_data['volume_sma']
-            current_price = latest_data['close']
-            ema_short_current = latest_data['ema_short']
-            ema_long_current = latest_data['ema_long']
-            volume_ma_current = latest_data['volume_ma']
-            macd_line_current = latest_data['macd_line']
-            macd_histogram_current = latest_data['macd_histogram']
-            vwap_current = latest_data['vwap']
-            rsi_current = latest_data['rsi']
-            obv_current = latest_data['obv']
+            # Decide once which checks have enough history; disabled blocks keep their False defaults
+            n = len(data)
+            enabled = {
+                'progression': n >= required_periods,
+                'ema': n >= max(ema_short, ema_long) + 5,
+                'macd': n >= max(macd_fast, macd_slow) + macd_signal + 5,
+                'sideways': n >= sideways_days + 5,
+                'vwap': n >= vwap_period + bottom_lookback,
+                'triple': n >= max(volume_avg_period, rsi_period, obv_period),
+                'triangle': n >= triangle_period,
+                'divergence': n >= divergence_period,
+                'bb': n >= bb_period,
+                'fib': n >= fib_lookback_period,
+            }
+            enabled = _make_block_gate(patterns)(enabled)
             
             # Check volume progression criteria - dynamic based on periods_to_check
             volume_progression_check = False
             volume_trend = "Yetersiz Veri"
             
-            # Calculate required minimum data points for the check
-            required_periods = periods_to_check + 1  # Need one more data point for comparison
-            
-            if len(data) >= required_periods:
+            if enabled['progression']:
                 # Get last N+1 volumes for progression check
-                last_volumes = data['volume'].tail(required_periods).values
+                last_volumes = volume_arr[-required_periods:]
                 
                 # Check if each period has higher volume than previous
-                volume_progression_check = True
-                for i in range(1, len(last_volumes)):
-                    if last_volumes[i] <= last_volumes[i-1]:
-                        volume_progression_check = False
-                        break
+                volume_progression_check = bool(np.all(np.diff(last_volumes) > 0))
                 
                 if volume_progression_check:
                     volume_trend = f"{periods_to_check} Periyot Artış ✓"
                 else:
                     volume_trend = "Artış Yok ✗"
-            elif len(data) >= 3:
+            elif n >= 3:
                 # Fallback to simple trend for less data
-                recent_volumes = data['volume'].tail(3).values
+                recent_volumes = volume_arr[-3:]
                 volume_trend = self._calculate_trend(recent_volumes)
             
             # Check EMA Golden Cross
             golden_cross = False
             golden_cross_recent = False
             
-            if len(data) >= max(ema_short, ema_long) + 5:
+            if enabled['ema']:
                 # Check if EMA short is above EMA long (current golden cross state)
                 golden_cross = ema_short_current > ema_long_current
                 
                 # Check if golden cross happened recently (within last 5 periods)
-                for i in range(1, min(6, len(data))):
-                    prev_short = data['ema_short'].iloc[-(i+1)]
-                    prev_long = data['ema_long'].iloc[-(i+1)]
-                    curr_short = data['ema_short'].iloc[-i]
-                    curr_long = data['ema_long'].iloc[-i]
-                    
-                    if prev_short <= prev_long and curr_short > curr_long:
-                        golden_cross_recent = True
-                        break
+                short_tail = ema_short_arr[-6:]
+                long_tail = ema_long_arr[-6:]
+                crossings = (short_tail[:-1] <= long_tail[:-1]) & (short_tail[1:] > long_tail[1:])
+                golden_cross_recent = bool(crossings.any())
             
             # Check MACD Zero Line Breakout
             macd_zero_breakout = False
             macd_zero_breakout_recent = False
             macd_histogram_positive = macd_histogram_current > 0
             
-            if len(data) >= max(macd_fast, macd_slow) + macd_signal + 5:
+            if enabled['macd']:
                 # Current MACD above zero
                 macd_zero_breakout = macd_line_current > 0
                 
                 # Check if MACD crossed zero recently (within last 5 periods)
-                for i in range(1, min(6, len(data))):
-                    prev_macd = data['macd_line'].iloc[-(i+1)]
-                    curr_macd = data['macd_line'].iloc[-i]
-                    
-                    if prev_macd <= 0 and curr_macd > 0:
-                        macd_zero_breakout_recent = True
-                        break
+                macd_tail = macd_arr[-6:]
+                macd_zero_breakout_recent = bool(((macd_tail[:-1] <= 0) & (macd_tail[1:] > 0)).any())
             
             # Check sideways movement before breakout
             sideways_movement = False
-            if len(data) >= sideways_days + 5:
+            if enabled['sideways']:
                 # Get price data for sideways analysis
-                sideways_period = data['close'].tail(sideways_days + 1)
+                sideways_period = close_arr[-(sideways_days + 1):]
                 if len(sideways_period) > 1:
                     price_max = sideways_period.max()
                     price_min = sideways_period.min()
@@ -515,48 +910,40 @@ class BISTVolumeAnalyzer:
             vwap_breakout_recent = False
             rising_bottoms = False
             
-            if len(data) >= vwap_period + bottom_lookback:
+            if enabled['vwap']:
                 # Check if price went below VWAP and came back above
-                recent_data = data.tail(10)  # Last 10 periods
-                vwap_below_count = 0
-                vwap_above_recent = False
+                low_tail = low_arr[-10:]  # Last 10 periods
+                close_tail = close_arr[-10:]
+                vwap_tail = vwap_arr[-10:]
+                
+                # Check if price went below VWAP (with tolerance)
+                below = low_tail < vwap_tail * (1 - support_tolerance/100)
+                vwap_below_count = int(below.sum())
                 
-                for i in range(len(recent_data)):
-                    row = recent_data.iloc[i]
-                    vwap_val = row['vwap']
-                    low_price = row['low']
-                    close_price = row['close']
-                    
-                    # Check if price went below VWAP (with tolerance)
-                    if low_price < vwap_val * (1 - support_tolerance/100):
-                        vwap_below_count += 1
-                    
-                    # Check if recent close is above VWAP
-                    if i >= len(recent_data) - 3:  # Last 3 periods
-                        if close_price > vwap_val:
-                            vwap_above_recent = True
+                # Check if a close in the last 3 periods is above VWAP
+                vwap_above_recent = bool((close_tail[-3:] > vwap_tail[-3:]).any())
                 
                 vwap_support_test = vwap_below_count > 0 and vwap_above_recent
                 vwap_breakout_recent = current_price > vwap_current
                 
                 # Check for rising bottoms
-                rising_bottoms = self._check_rising_bottoms(data, bottom_lookback)
+                rising_bottoms = self._check_rising_bottoms(low_arr, bottom_lookback)
             
             # Check Triple Volume Confirmation
             triple_volume_confirmed = False
             rsi_in_range = False
             obv_at_peak = False
             
-            if len(data) >= max(volume_avg_period, rsi_period, obv_period):
+            if enabled['triple']:
                 # 1. Volume confirmation
-                volume_ma_triple = data['volume'].tail(volume_avg_period).mean()
+                volume_ma_triple = volume_arr[-volume_avg_period:].mean()
                 triple_volume_confirmed = current_volume >= (volume_ma_triple * volume_multiplier_triple)
                 
                 # 2. RSI in optimal range
                 rsi_in_range = rsi_min <= rsi_current <= rsi_max
                 
                 # 3. OBV at peak levels
-                obv_period_data = data['obv'].tail(obv_period)
+                obv_period_data = obv_arr[-obv_period:]
                 obv_percentile = (obv_current - obv_period_data.min()) / (obv_period_data.max() - obv_period_data.min()) * 100
                 obv_at_peak = obv_percentile >= obv_threshold
             
@@ -566,16 +953,16 @@ class BISTVolumeAnalyzer:
             breakout_confirmed = False
             breakout_direction_correct = False
             
-            if len(data) >= triangle_period:
+            if enabled['triangle']:
                 # 1. Detect triangle formation (converging price action)
-                triangle_detected = self._detect_triangle_formation(data, triangle_period, convergence_threshold)
+                triangle_detected = self._detect_triangle_formation(high_arr, low_arr, triangle_period, convergence_threshold)
                 
                 # 2. Check volume decline during formation
-                volume_declined = self._check_volume_decline(data, volume_decline_period, volume_decline_threshold)
+                volume_declined = self._check_volume_decline(volume_arr, volume_decline_period, volume_decline_threshold)
                 
                 # 3. Check breakout with volume increase
                 breakout_confirmed, breakout_direction_detected = self._check_breakout_with_volume(
-                    data, current_volume, breakout_volume_increase
+                    close_arr, high_arr, low_arr, volume_arr, current_volume, breakout_volume_increase
                 )
                 
                 # 4. Check if breakout direction matches requirement
@@ -586,26 +973,28 @@ class BISTVolumeAnalyzer:
                 elif breakout_direction == "Aşağı":
                     breakout_direction_correct = breakout_confirmed and breakout_direction_detected == "down"
             
+            # Average volume of the previous 5 days (excluding current), shared by the
+            # breakout, squeeze and Fibonacci volume confirmations
+            avg_vol_5 = volume_arr[-6:-1].mean() if n >= 5 else np.nan
+            
             # Check RSI Divergence + Trend Breakout Pattern
             rsi_divergence_detected = False
             rsi_oversold = False
             resistance_broken = False
             volume_confirmed_breakout = False
             
-            if len(data) >= divergence_period:
+            if enabled['divergence']:
                 # 1. Check for positive RSI divergence (price lower lows, RSI higher lows)
-                rsi_divergence_detected = self._detect_rsi_divergence(data, divergence_period, min_divergence_strength, rsi_period)
+                rsi_divergence_detected = self._detect_rsi_divergence(low_arr, rsi_arr, divergence_period, min_divergence_strength, rsi_period)
                 
                 # 2. Check if RSI was in oversold territory
-                rsi_oversold = data['rsi'].iloc[-divergence_period:].min() <= rsi_oversold_threshold
+                rsi_oversold = rsi_arr[-divergence_period:].min() <= rsi_oversold_threshold
                 
                 # 3. Check for resistance breakout
-                resistance_broken = self._check_resistance_breakout(data, resistance_period, resistance_breakout_percent)
+                resistance_broken = self._check_resistance_breakout(close_arr, high_arr, resistance_period, resistance_breakout_percent)
                 
                 # 4. Check volume confirmation for breakout
-                volume_confirmed_breakout = self._check_volume_confirmation_breakout(
-                    data, current_volume, volume_breakout_multiplier
-                )
+                volume_confirmed_breakout = current_volume >= avg_vol_5 * volume_breakout_multiplier
             
             # Check Bollinger Band Squeeze + Breakout Pattern
             bb_squeeze_detected = False
@@ -613,21 +1002,26 @@ class BISTVolumeAnalyzer:
             volume_confirmed_squeeze = False
             consecutive_upper_closes = False
             
-            if len(data) >= bb_period:
+            if enabled['bb']:
+                # Rolling mean/std are computed once and shared by the band checks
+                bb_sma, bb_std = self._bollinger_stats(close_arr, bb_period)
+                
                 # 1. Calculate Bollinger Bands and detect squeeze
-                bb_squeeze_detected = self._detect_bollinger_squeeze(data, bb_period, bb_std_dev, squeeze_period, squeeze_percentile)
+                bb_squeeze_detected = self._detect_bollinger_squeeze(
+                    bb_sma, bb_std, bb_period, bb_std_dev, squeeze_period, squeeze_percentile
+                )
                 
                 # 2. Check upper band breakout
-                upper_band_broken = self._check_upper_band_breakout(data, bb_period, bb_std_dev, upper_band_breakout_percent)
+                upper_band_broken = self._check_upper_band_breakout(
+                    close_arr, bb_sma, bb_std, bb_period, bb_std_dev, upper_band_breakout_percent
+                )
                 
                 # 3. Check volume confirmation for squeeze breakout
-                volume_confirmed_squeeze = self._check_volume_confirmation_breakout(
-                    data, current_volume, volume_squeeze_multiplier
-                )
+                volume_confirmed_squeeze = current_volume >= avg_vol_5 * volume_squeeze_multiplier
                 
                 # 4. Check consecutive days of upper band proximity
                 consecutive_upper_closes = self._check_consecutive_upper_closes(
-                    data, bb_period, bb_std_dev, consecutive_days
+                    close_arr, bb_sma, bb_std, bb_period, bb_std_dev, consecutive_days
                 )
             
             # Check Fibonacci Retest + Harmonic Pattern
@@ -636,759 +1030,498 @@ class BISTVolumeAnalyzer:
             fib_support_confirmed = False
             volume_confirmed_fib = False
             
-            if len(data) >= fib_lookback_period:
+            if enabled['fib']:
                 # 1. Detect Fibonacci retracement levels
                 fib_retracement_detected = self._detect_fibonacci_retracement(
-                    data, fib_lookback_period, fib_retracement_min, fib_retracement_max, fib_support_tolerance
+                    close_arr, high_arr, low_arr, fib_lookback_period, fib_retracement_min, fib_retracement_max, fib_support_tolerance
                 )
                 
                 # 2. Detect harmonic patterns
                 harmonic_pattern_detected = self._detect_harmonic_pattern(
-                    data, harmonic_pattern_type, harmonic_tolerance, fib_lookback_period
+                    close_arr, harmonic_pattern_type, harmonic_tolerance, fib_lookback_period
                 )
                 
                 # 3. Check Fibonacci support confirmation
                 fib_support_confirmed = self._check_fibonacci_support(
-                    data, fib_lookback_period, fib_retracement_min, fib_retracement_max, fib_support_tolerance
+                    close_arr, low_arr, fib_lookback_period, fib_retracement_min, fib_retracement_max, fib_support_tolerance
                 )
                 
                 # 4. Check volume confirmation for support test
-                volume_confirmed_fib = self._check_volume_confirmation_breakout(
-                    data, current_volume, fib_volume_multiplier
-                )
+                volume_confirmed_fib = current_volume >= avg_vol_5 * fib_volume_multiplier
+            
+            return AnalysisResult(
+                symbol=symbol,
+                current_volume=current_volume,
+                volume_sma=volume_sma,
+                volume_ma=volume_ma_current,
+                current_price=current_price,
+                volume_trend=volume_trend,
+                volume_ratio=current_volume / volume_sma,
+                volume_progression_check=volume_progression_check,
+                ema_short=ema_short_current,
+                ema_long=ema_long_current,
+                golden_cross=golden_cross,
+                golden_cross_recent=golden_cross_recent,
+                macd_line=macd_line_current,
+                macd_histogram=macd_histogram_current,
+                macd_zero_breakout=macd_zero_breakout,
+                macd_zero_breakout_recent=macd_zero_breakout_recent,
+                macd_histogram_positive=macd_histogram_positive,
+                sideways_movement=sideways_movement,
+                vwap=vwap_current,
+                vwap_support_test=vwap_support_test,
+                vwap_breakout_recent=vwap_breakout_recent,
+                rising_bottoms=rising_bottoms,
+                rsi=rsi_current,
+                obv=obv_current,
+                triple_volume_confirmed=triple_volume_confirmed,
+                rsi_in_range=rsi_in_range,
+                obv_at_peak=obv_at_peak,
+                triangle_detected=triangle_detected,
+                volume_declined=volume_declined,
+                breakout_confirmed=breakout_confirmed,
+                breakout_direction_correct=breakout_direction_correct,
+                rsi_divergence_detected=rsi_divergence_detected,
+                rsi_oversold=rsi_oversold,
+                resistance_broken=resistance_broken,
+                volume_confirmed_breakout=volume_confirmed_breakout,
+                bb_squeeze_detected=bb_squeeze_detected,
+                upper_band_broken=upper_band_broken,
+                volume_confirmed_squeeze=volume_confirmed_squeeze,
+                consecutive_upper_closes=consecutive_upper_closes,
+                fib_retracement_detected=fib_retracement_detected,
+                harmonic_pattern_detected=harmonic_pattern_detected,
+                fib_support_confirmed=fib_support_confirmed,
+                volume_confirmed_fib=volume_confirmed_fib,
+                data_points=n,
+                last_update=datetime.now()
+            )
             
-            # Validate data
-            if pd.isna(current_volume) or pd.isna(volume_sma) or volume_sma == 0:
-                return None
-            
-            return {
-                'symbol': symbol,
-                'current_volume': current_volume,
-                'volume_sma': volume_sma,
-                'volume_ma': volume_ma_current,
-                'current_price': current_price,
-                'volume_trend': volume_trend,
-                'volume_ratio': current_volume / volume_sma,
-                'volume_progression_check': volume_progression_check,
-                'ema_short': ema_short_current,
-                'ema_long': ema_long_current,
-                'golden_cross': golden_cross,
-                'golden_cross_recent': golden_cross_recent,
-                'macd_line': macd_line_current,
-                'macd_histogram': macd_histogram_current,
-                'macd_zero_breakout': macd_zero_breakout,
-                'macd_zero_breakout_recent': macd_zero_breakout_recent,
-                'macd_histogram_positive': macd_histogram_positive,
-                'sideways_movement': sideways_movement,
-                'vwap': vwap_current,
-                'vwap_support_test': vwap_support_test,
-                'vwap_breakout_recent': vwap_breakout_recent,
-                'rising_bottoms': rising_bottoms,
-                'rsi': rsi_current,
-                'obv': obv_current,
-                'triple_volume_confirmed': triple_volume_confirmed,
-                'rsi_in_range': rsi_in_range,
-                'obv_at_peak': obv_at_peak,
-                'triangle_detected': triangle_detected,
-                'volume_declined': volume_declined,
-                'breakout_confirmed': breakout_confirmed,
-                'breakout_direction_correct': breakout_direction_correct,
-                'rsi_divergence_detected': rsi_divergence_detected,
-                'rsi_oversold': rsi_oversold,
-                'resistance_broken': resistance_broken,
-                'volume_confirmed_breakout': volume_confirmed_breakout,
-                'bb_squeeze_detected': bb_squeeze_detected,
-                'upper_band_broken': upper_band_broken,
-                'volume_confirmed_squeeze': volume_confirmed_squeeze,
-                'consecutive_upper_closes': consecutive_upper_closes,
-                'fib_retracement_detected': fib_retracement_detected,
-                'harmonic_pattern_detected': harmonic_pattern_detected,
-                'fib_support_confirmed': fib_support_confirmed,
-                'volume_confirmed_fib': volume_confirmed_fib,
-                'data_points': len(data),
-                'last_update': datetime.now()
-            }
-            
-        except Exception as e:
-            print(f"Error analyzing {symbol}: {str(e)}")
+        except Exception:
+            _analysis_error_logger.exception("Error analyzing %s", symbol)
             return None
     
+    def _enrich(self, data, sma_period, volume_period, ema_short, ema_long,
+                macd_fast, macd_slow, macd_signal, vwap_period, rsi_period):
+        """Attach volume averages, EMAs, MACD, VWAP, RSI and OBV columns to data in place"""
+        close = data['close']
+        volume = data['volume']
+        
+        # Price EMAs for golden cross and MACD, each distinct span computed once
+        close_emas = self._close_emas(close, (ema_short, ema_long, macd_fast, macd_slow))
+        macd_line = close_emas[macd_fast] - close_emas[macd_slow]
+        macd_signal_line = _indicators.ema(macd_line, macd_signal)
+        
+        # Calculate volume SMA and volume moving average for comparison
+        volume_values = volume.to_numpy(dtype=np.float64)
+        data['volume_sma'] = _indicators.sma(volume_values, sma_period)
+        data['volume_ma'] = _indicators.sma(volume_values, volume_period)
+        
+        data['ema_short'] = close_emas[ema_short]
+        data['ema_long'] = close_emas[ema_long]
+        data['macd_line'] = macd_line
+        data['macd_signal'] = macd_signal_line
+        data['macd_histogram'] = macd_line - macd_signal_line
+        
+        data['vwap'] = self._calculate_vwap(data, vwap_period)
+        data['rsi'] = self._calculate_rsi_series(close, rsi_period)
+        data['obv'] = self._calculate_obv(data)
+        
+        return data
+    
+    def _close_emas(self, close, spans):
+        """Calculate price EMAs keyed by span, computing each distinct span only once"""
+        close_values = close.to_numpy(dtype=np.float64)
+        return {span: _indicators.ema(close_values, span) for span in set(spans)}
+    
     def _calculate_vwap(self, data, period):
         """Calculate Volume Weighted Average Price"""
-        try:
-            # Calculate typical price (High + Low + Close) / 3
-            typical_price = (data['high'] + data['low'] + data['close']) / 3
-            
-            # Calculate VWAP using rolling window
-            vwap_values = []
-            for i in range(len(data)):
-                start_idx = max(0, i - period + 1)
-                period_data = data.iloc[start_idx:i+1]
-                
-                if len(period_data) > 0:
-                    tp = (period_data['high'] + period_data['low'] + period_data['close']) / 3
-                    vol = period_data['volume']
-                    
-                    # VWAP = Sum(Typical Price * Volume) / Sum(Volume)
-                    if vol.sum() > 0:
-                        vwap = (tp * vol).sum() / vol.sum()
-                    else:
-                        vwap = tp.iloc[-1]  # Fallback to typical price
-                else:
-                    vwap = typical_price.iloc[i]
-                
-                vwap_values.append(vwap)
-            
-            return pd.Series(vwap_values, index=data.index)
-            
-        except Exception as e:
-            print(f"Error calculating VWAP: {str(e)}")
-            return pd.Series([0] * len(data), index=data.index)
+        # VWAP = Sum(Typical Price * Volume) / Sum(Volume) over a rolling window
+        vwap_values = _indicators.vwap(
+            data['high'].to_numpy(dtype=np.float64),
+            data['low'].to_numpy(dtype=np.float64),
+            data['close'].to_numpy(dtype=np.float64),
+            data['volume'].to_numpy(dtype=np.float64),
+            period
+        )
+        return pd.Series(vwap_values, index=data.index)
     
-    def _check_rising_bottoms(self, data, lookback_period):
+    def _check_rising_bottoms(self, low, lookback_period):
         """Check if recent bottoms are rising"""
-        try:
-            if len(data) < lookback_period + 5:
-                return False
-            
-            recent_data = data.tail(lookback_period + 5)
-            lows = recent_data['low'].values
-            
-            # Find local minima (bottoms)
-            bottoms = []
-            for i in range(1, len(lows) - 1):
-                if lows[i] < lows[i-1] and lows[i] < lows[i+1]:
-                    bottoms.append((i, lows[i]))
-            
-            # Need at least 2 bottoms to compare
-            if len(bottoms) < 2:
-                return False
-            
-            # Check if last bottom is higher than previous bottom
-            recent_bottoms = sorted(bottoms, key=lambda x: x[0])[-2:]  # Last 2 bottoms
-            return recent_bottoms[1][1] > recent_bottoms[0][1]
-            
-        except Exception as e:
-            print(f"Error checking rising bottoms: {str(e)}")
+        if len(low) < lookback_period + 5:
+            return False
+        
+        lows = low[-(lookback_period + 5):]
+        
+        # Find local minima (bottoms)
+        bottoms = []
+        for i in range(1, len(lows) - 1):
+            if lows[i] < lows[i-1] and lows[i] < lows[i+1]:
+                bottoms.append((i, lows[i]))
+        
+        # Need at least 2 bottoms to compare
+        if len(bottoms) < 2:
             return False
+        
+        # Check if last bottom is higher than previous bottom
+        recent_bottoms = sorted(bottoms, key=lambda x: x[0])[-2:]  # Last 2 bottoms
+        return recent_bottoms[1][1] > recent_bottoms[0][1]
     
-    def _calculate_rsi(self, prices, period=14):
-        """Calculate Relative Strength Index"""
-        try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi.fillna(50)
-            
-        except Exception as e:
-            print(f"Error calculating RSI: {str(e)}")
-            return pd.Series([50] * len(prices), index=prices.index)
+    def _calculate_rsi_series(self, prices, period=14):
+        """Calculate Relative Strength Index for every bar"""
+        rsi = _indicators.rsi(prices.to_numpy(dtype=np.float64), period)
+        return pd.Series(rsi, index=prices.index)
     
     def _calculate_obv(self, data):
         """Calculate On Balance Volume"""
-        try:
-            obv = []
-            obv_value = 0
-            
-            for i in range(len(data)):
-                if i == 0:
-                    obv_value = data['volume'].iloc[i]
-                else:
-                    prev_close = data['close'].iloc[i-1]
-                    curr_close = data['close'].iloc[i]
-                    curr_volume = data['volume'].iloc[i]
-                    
-                    if curr_close > prev_close:
-                        obv_value += curr_volume
-                    elif curr_close < prev_close:
-                        obv_value -= curr_volume
-                    # If close == prev_close, OBV stays the same
-                
-                obv.append(obv_value)
-            
-            return pd.Series(obv, index=data.index)
-            
-        except Exception as e:
-            print(f"Error calculating OBV: {str(e)}")
-            return pd.Series([0] * len(data), index=data.index)
+        obv = _indicators.obv(
+            data['close'].to_numpy(dtype=np.float64),
+            data['volume'].to_numpy(dtype=np.float64)
+        )
+        return pd.Series(obv, index=data.index)
     
-    def _detect_triangle_formation(self, data, period, convergence_threshold):
+    def _detect_triangle_formation(self, high, low, period, convergence_threshold):
         """Detect triangle formation (converging price action)"""
-        try:
-            # Get recent data for triangle detection
-            recent_data = data.tail(period)
-            
-            if len(recent_data) < 10:
-                return False
-            
-            # Calculate highs and lows
-            highs = recent_data['high']
-            lows = recent_data['low']
-            
-            # Find trend lines for highs and lows
-            high_trend_slope = self._calculate_trend_slope(highs)
-            low_trend_slope = self._calculate_trend_slope(lows)
-            
-            # Triangle: high trend line should be declining, low trend line should be inclining
-            # Or both converging towards each other
-            price_range_start = highs.iloc[0] - lows.iloc[0]
-            price_range_end = highs.iloc[-1] - lows.iloc[-1]
-            
-            if price_range_start > 0:
-                convergence_percent = ((price_range_start - price_range_end) / price_range_start) * 100
-                return convergence_percent >= convergence_threshold
-            
-            return False
-            
-        except Exception as e:
-            print(f"Error detecting triangle formation: {str(e)}")
+        # Get recent highs and lows for triangle detection
+        highs = high[-period:]
+        lows = low[-period:]
+        
+        if len(highs) < 10:
             return False
+        
+        # Find trend lines for highs and lows
+        high_trend_slope = self._calculate_trend_slope(highs)
+        low_trend_slope = self._calculate_trend_slope(lows)
+        
+        # Triangle: high trend line should be declining, low trend line should be inclining
+        # Or both converging towards each other
+        price_range_start = highs[0] - lows[0]
+        price_range_end = highs[-1] - lows[-1]
+        
+        if price_range_start > 0:
+            convergence_percent = ((price_range_start - price_range_end) / price_range_start) * 100
+            return convergence_percent >= convergence_threshold
+        
+        return False
     
     def _calculate_trend_slope(self, series):
         """Calculate trend line slope using linear regression"""
-        try:
-            import numpy as np
-            
-            x = np.arange(len(series))
-            y = series.values
-            
-            # Simple linear regression
-            n = len(x)
-            sum_x = np.sum(x)
-            sum_y = np.sum(y)
-            sum_xy = np.sum(x * y)
-            sum_x2 = np.sum(x * x)
-            
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-            return slope
-            
-        except Exception as e:
-            print(f"Error calculating trend slope: {str(e)}")
-            return 0
+        return _indicators.trend_slope(np.asarray(series, dtype=np.float64))
     
-    def _check_volume_decline(self, data, period, threshold):
+    def _check_volume_decline(self, volume, period, threshold):
         """Check if volume has declined during the formation period"""
-        try:
-            if len(data) < period:
-                return False
-            
-            # Compare early vs late volume in the formation period
-            recent_data = data.tail(period)
-            early_volume = recent_data['volume'].head(period // 2).mean()
-            late_volume = recent_data['volume'].tail(period // 2).mean()
-            
-            if early_volume > 0:
-                decline_percent = ((early_volume - late_volume) / early_volume) * 100
-                return decline_percent >= threshold
-            
-            return False
-            
-        except Exception as e:
-            print(f"Error checking volume decline: {str(e)}")
+        if len(volume) < period:
             return False
+        
+        # Compare early vs late volume in the formation period
+        recent_volume = volume[-period:]
+        half = period // 2
+        early_volume = recent_volume[:half].mean()
+        late_volume = recent_volume[period - half:].mean()
+        
+        if early_volume > 0:
+            decline_percent = ((early_volume - late_volume) / early_volume) * 100
+            return decline_percent >= threshold
+        
+        return False
     
-    def _check_breakout_with_volume(self, data, current_volume, volume_increase_threshold):
+    def _check_breakout_with_volume(self, close, high, low, volume, current_volume, volume_increase_threshold):
         """Check if there's a breakout with volume increase"""
-        try:
-            if len(data) < 5:
-                return False, None
-            
-            # Get recent data for breakout detection
-            recent_data = data.tail(5)
-            current_price = recent_data['close'].iloc[-1]
-            previous_prices = recent_data['close'].iloc[:-1]
-            
-            # Calculate recent volume average (exclude current day)
-            recent_volume_avg = recent_data['volume'].iloc[:-1].mean()
-            
-            # Check volume increase
-            if recent_volume_avg > 0:
-                volume_increase_percent = ((current_volume - recent_volume_avg) / recent_volume_avg) * 100
-                volume_breakout = volume_increase_percent >= volume_increase_threshold
-            else:
-                volume_breakout = False
-            
-            # Determine breakout direction
-            recent_high = recent_data['high'].iloc[:-1].max()
-            recent_low = recent_data['low'].iloc[:-1].min()
-            
-            breakout_direction = None
-            price_breakout = False
-            
-            if current_price > recent_high:
-                breakout_direction = "up"
-                price_breakout = True
-            elif current_price < recent_low:
-                breakout_direction = "down"
-                price_breakout = True
-            
-            return (volume_breakout and price_breakout), breakout_direction
-            
-        except Exception as e:
-            print(f"Error checking breakout with volume: {str(e)}")
+        if len(close) < 5:
             return False, None
+        
+        # Last 5 bars for breakout detection
+        current_price = close[-1]
+        
+        # Calculate recent volume average (exclude current day)
+        recent_volume_avg = volume[-5:-1].mean()
+        
+        # Check volume increase
+        if recent_volume_avg > 0:
+            volume_increase_percent = ((current_volume - recent_volume_avg) / recent_volume_avg) * 100
+            volume_breakout = volume_increase_percent >= volume_increase_threshold
+        else:
+            volume_breakout = False
+        
+        # Determine breakout direction
+        recent_high = high[-5:-1].max()
+        recent_low = low[-5:-1].min()
+        
+        breakout_direction = None
+        price_breakout = False
+        
+        if current_price > recent_high:
+            breakout_direction = "up"
+            price_breakout = True
+        elif current_price < recent_low:
+            breakout_direction = "down"
+            price_breakout = True
+        
+        return (volume_breakout and price_breakout), breakout_direction
     
-    def _detect_rsi_divergence(self, data, period, min_strength, rsi_period):
+    def _detect_rsi_divergence(self, low, rsi, period, min_strength, rsi_period):
         """Detect positive RSI divergence (price lower lows, RSI higher lows)"""
-        try:
-            if len(data) < period:
-                return False
-            
-            # Get recent data for divergence analysis
-            recent_data = data.tail(period)
-            prices = recent_data['low']  # Use lows for divergence detection
-            rsi_values = recent_data['rsi']
-            
-            # Find local minima in both price and RSI
-            price_lows = self._find_local_minima(prices, window=3)
-            rsi_lows = self._find_local_minima(rsi_values, window=3)
-            
-            if len(price_lows) < 2 or len(rsi_lows) < 2:
-                return False
-            
-            # Check for divergence: price making lower lows, RSI making higher lows
-            last_price_low = price_lows[-1]
-            prev_price_low = price_lows[-2]
-            last_rsi_low = rsi_lows[-1]
-            prev_rsi_low = rsi_lows[-2]
-            
-            # Price divergence: current low should be lower than previous low
-            price_divergence = prices.iloc[last_price_low] < prices.iloc[prev_price_low]
-            
-            # RSI divergence: current RSI low should be higher than previous RSI low
-            rsi_divergence = rsi_values.iloc[last_rsi_low] > rsi_values.iloc[prev_rsi_low]
-            
-            # Calculate divergence strength
-            if price_divergence and rsi_divergence:
-                price_change = abs(prices.iloc[last_price_low] - prices.iloc[prev_price_low]) / prices.iloc[prev_price_low]
-                rsi_change = abs(rsi_values.iloc[last_rsi_low] - rsi_values.iloc[prev_rsi_low]) / 100.0
-                
-                # Divergence strength is the ratio of changes
-                divergence_strength = (rsi_change / max(price_change, 0.001)) if price_change > 0 else 0
-                
-                return divergence_strength >= min_strength
-            
+        if len(low) < period:
             return False
-            
-        except Exception as e:
-            print(f"Error detecting RSI divergence: {str(e)}")
+        
+        # Get recent data for divergence analysis
+        prices = low[-period:]  # Use lows for divergence detection
+        rsi_values = rsi[-period:]
+        
+        # Find local minima in both price and RSI
+        price_lows = self._find_local_minima(prices, window=3)
+        rsi_lows = self._find_local_minima(rsi_values, window=3)
+        
+        if len(price_lows) < 2 or len(rsi_lows) < 2:
             return False
+        
+        # Check for divergence: price making lower lows, RSI making higher lows
+        last_price_low = price_lows[-1]
+        prev_price_low = price_lows[-2]
+        last_rsi_low = rsi_lows[-1]
+        prev_rsi_low = rsi_lows[-2]
+        
+        # Price divergence: current low should be lower than previous low
+        price_divergence = prices[last_price_low] < prices[prev_price_low]
+        
+        # RSI divergence: current RSI low should be higher than previous RSI low
+        rsi_divergence = rsi_values[last_rsi_low] > rsi_values[prev_rsi_low]
+        
+        # Calculate divergence strength
+        if price_divergence and rsi_divergence:
+            price_change = abs(prices[last_price_low] - prices[prev_price_low]) / prices[prev_price_low]
+            rsi_change = abs(rsi_values[last_rsi_low] - rsi_values[prev_rsi_low]) / 100.0
+            
+            # Divergence strength is the ratio of changes
+            divergence_strength = (rsi_change / max(price_change, 0.001)) if price_change > 0 else 0
+            
+            return divergence_strength >= min_strength
+        
+        return False
     
     def _find_local_minima(self, series, window=3):
         """Find local minima in a time series"""
-        try:
-            minima = []
-            for i in range(window, len(series) - window):
-                is_minimum = True
-                for j in range(i - window, i + window + 1):
-                    if j != i and series.iloc[j] <= series.iloc[i]:
-                        is_minimum = False
-                        break
-                if is_minimum:
-                    minima.append(i)
-            return minima
-            
-        except Exception as e:
-            print(f"Error finding local minima: {str(e)}")
-            return []
+        return _indicators.local_minima(np.asarray(series, dtype=np.float64), window).tolist()
     
-    def _check_resistance_breakout(self, data, period, breakout_percent):
+    def _check_resistance_breakout(self, close, high, period, breakout_percent):
         """Check if price has broken through resistance level"""
-        try:
-            if len(data) < period + 1:
-                return False
-            
-            # Get resistance level (highest high in the period, excluding current day)
-            resistance_data = data.iloc[-(period+1):-1]  # Exclude current day
-            resistance_level = resistance_data['high'].max()
-            
-            # Current price
-            current_price = data['close'].iloc[-1]
-            
-            # Check if current price broke resistance by the required percentage
-            breakout_threshold = resistance_level * (1 + breakout_percent / 100)
-            
-            return current_price >= breakout_threshold
-            
-        except Exception as e:
-            print(f"Error checking resistance breakout: {str(e)}")
+        if len(close) < period + 1:
             return False
+        
+        # Get resistance level (highest high in the period, excluding current day)
+        resistance_level = high[-(period+1):-1].max()  # Exclude current day
+        
+        # Current price
+        current_price = close[-1]
+        
+        # Check if current price broke resistance by the required percentage
+        breakout_threshold = resistance_level * (1 + breakout_percent / 100)
+        
+        return current_price >= breakout_threshold
     
-    def _check_volume_confirmation_breakout(self, data, current_volume, multiplier):
-        """Check if volume confirms the breakout"""
-        try:
-            if len(data) < 5:
-                return False
-            
-            # Average volume of previous days (exclude current)
-            avg_volume = data['volume'].iloc[-6:-1].mean()  # Last 5 days excluding current
-            
-            # Check if current volume is above threshold
-            return current_volume >= (avg_volume * multiplier)
-            
-        except Exception as e:
-            print(f"Error checking volume confirmation for breakout: {str(e)}")
-            return False
+    def _bollinger_stats(self, close, period):
+        """Rolling SMA and sample standard deviation of closes, NaN-padded to len(close)"""
+        sma = _indicators.sma(close, period)
+        std = np.full(len(close), np.nan)
+        if 0 < period <= len(close):
+            std[period - 1:] = sliding_window_view(close, period).std(axis=1, ddof=1)
+        return sma, std
     
-    def _detect_bollinger_squeeze(self, data, period, std_dev, squeeze_months, percentile):
+    def _detect_bollinger_squeeze(self, sma, std, period, std_dev, squeeze_months, percentile):
         """Detect Bollinger Band squeeze (band width at lowest levels)"""
-        try:
-            if len(data) < period * 22 * squeeze_months:  # Approximate trading days in months
-                return False
-            
-            # Calculate Bollinger Bands
-            close_prices = data['close']
-            sma = close_prices.rolling(window=period).mean()
-            std = close_prices.rolling(window=period).std()
-            
-            upper_band = sma + (std * std_dev)
-            lower_band = sma - (std * std_dev)
-            
-            # Calculate band width (normalized by price)
-            band_width = (upper_band - lower_band) / sma * 100
-            
-            # Get squeeze period data (months to days conversion)
-            squeeze_days = squeeze_months * 22  # Approximate trading days per month
-            historical_width = band_width.iloc[-squeeze_days:] if len(band_width) >= squeeze_days else band_width
-            
-            # Check if current band width is in the lowest percentile
-            current_width = band_width.iloc[-1]
-            percentile_threshold = historical_width.quantile(percentile / 100.0)
-            
-            return current_width <= percentile_threshold
-            
-        except Exception as e:
-            print(f"Error detecting Bollinger squeeze: {str(e)}")
+        if len(sma) < period * 22 * squeeze_months:  # Approximate trading days in months
             return False
-    
-    def _check_upper_band_breakout(self, data, period, std_dev, breakout_percent):
-        """Check if price has broken above upper Bollinger Band"""
-        try:
-            if len(data) < period:
-                return False
-            
-            # Calculate current Bollinger Bands
-            close_prices = data['close']
-            sma = close_prices.rolling(window=period).mean().iloc[-1]
-            std = close_prices.rolling(window=period).std().iloc[-1]
-            
-            upper_band = sma + (std * std_dev)
-            current_price = data['close'].iloc[-1]
-            
-            # Check if price broke upper band by required percentage
-            breakout_threshold = upper_band * (1 + breakout_percent / 100)
-            
-            return current_price >= breakout_threshold
-            
-        except Exception as e:
-            print(f"Error checking upper band breakout: {str(e)}")
+        
+        # Get squeeze period data (months to days conversion)
+        squeeze_days = squeeze_months * 22  # Approximate trading days per month
+        
+        # Band width (upper - lower, normalized by price) over the squeeze window only
+        historical_width = (2 * std_dev * std[-squeeze_days:]) / sma[-squeeze_days:] * 100
+        
+        # Check if current band width is in the lowest percentile
+        current_width = historical_width[-1]
+        percentile_threshold = np.nanquantile(historical_width, percentile / 100.0)
+        
+        return bool(current_width <= percentile_threshold)
+    
+    def _check_upper_band_breakout(self, close, sma, std, period, std_dev, breakout_percent):
+        """Check if price has broken above upper Bollinger Band"""
+        if len(close) < period:
             return False
+        
+        # Current Bollinger Bands
+        upper_band = sma[-1] + (std[-1] * std_dev)
+        current_price = close[-1]
+        
+        # Check if price broke upper band by required percentage
+        breakout_threshold = upper_band * (1 + breakout_percent / 100)
+        
+        return bool(current_price >= breakout_threshold)
     
-    def _check_consecutive_upper_closes(self, data, period, std_dev, days):
+    def _check_consecutive_upper_closes(self, close, sma, std, period, std_dev, days):
         """Check for consecutive days of closes near upper band"""
-        try:
-            if len(data) < max(period, days):
-                return False
-            
-            # Calculate Bollinger Bands for last 'days' periods
-            close_prices = data['close']
-            sma = close_prices.rolling(window=period).mean()
-            std = close_prices.rolling(window=period).std()
-            upper_band = sma + (std * std_dev)
-            
-            # Check last 'days' closes
-            recent_closes = close_prices.iloc[-days:]
-            recent_upper_bands = upper_band.iloc[-days:]
-            
-            # Count consecutive closes within 2% of upper band
-            upper_band_proximity = 0.98  # Within 2% of upper band
-            consecutive_count = 0
-            
-            for i in range(len(recent_closes)):
-                if recent_closes.iloc[i] >= (recent_upper_bands.iloc[i] * upper_band_proximity):
-                    consecutive_count += 1
-                else:
-                    consecutive_count = 0
-            
-            return consecutive_count >= days
-            
-        except Exception as e:
-            print(f"Error checking consecutive upper closes: {str(e)}")
+        if len(close) < max(period, days):
             return False
+        
+        # Last 'days' closes against their Bollinger upper band
+        tail = slice(len(close) - days, None)
+        recent_closes = close[tail]
+        recent_upper_bands = sma[tail] + (std[tail] * std_dev)
+        
+        # Every close must be within 2% of the upper band
+        upper_band_proximity = 0.98  # Within 2% of upper band
+        return bool(np.all(recent_closes >= recent_upper_bands * upper_band_proximity))
     
-    def _detect_fibonacci_retracement(self, data, lookback_period, min_retracement, max_retracement, tolerance):
+    def _detect_fibonacci_retracement(self, close, high, low, lookback_period, min_retracement, max_retracement, tolerance):
         """Detect Fibonacci retracement levels and support"""
-        try:
-            if len(data) < lookback_period:
-                return False
-            
-            # Get recent data for analysis
-            recent_data = data.tail(lookback_period)
-            highs = recent_data['high']
-            lows = recent_data['low']
-            closes = recent_data['close']
-            
-            # Find significant swing high and low
-            swing_high = highs.max()
-            swing_low = lows.min()
-            swing_high_idx = highs.idxmax()
-            swing_low_idx = lows.idxmin()
-            
-            # Ensure we have a proper swing (high comes before low for retracement)
-            if swing_high_idx >= swing_low_idx:
-                return False
-            
-            # Calculate Fibonacci retracement levels
-            price_range = swing_high - swing_low
-            fib_382 = swing_high - (price_range * 0.382)
-            fib_500 = swing_high - (price_range * 0.500)
-            fib_618 = swing_high - (price_range * 0.618)
-            
-            # Current price
-            current_price = closes.iloc[-1]
-            
-            # Check if current price is within the specified retracement range
-            target_min_level = swing_high - (price_range * min_retracement / 100)
-            target_max_level = swing_high - (price_range * max_retracement / 100)
-            
-            # Check if price is near any Fibonacci level within tolerance
-            tolerance_range = price_range * tolerance / 100
-            
-            near_382 = abs(current_price - fib_382) <= tolerance_range
-            near_500 = abs(current_price - fib_500) <= tolerance_range
-            near_618 = abs(current_price - fib_618) <= tolerance_range
-            
-            # Price should be within the target retracement range and near a Fib level
-            in_range = target_max_level <= current_price <= target_min_level
-            near_fib_level = near_382 or near_500 or near_618
-            
-            return in_range and near_fib_level
-            
-        except Exception as e:
-            print(f"Error detecting Fibonacci retracement: {str(e)}")
+        if len(close) < lookback_period:
+            return False
+        
+        # Get recent data for analysis
+        highs = high[-lookback_period:]
+        lows = low[-lookback_period:]
+        
+        # Find significant swing high and low
+        swing_high_idx = int(np.argmax(highs))
+        swing_low_idx = int(np.argmin(lows))
+        swing_high = highs[swing_high_idx]
+        swing_low = lows[swing_low_idx]
+        
+        # Ensure we have a proper swing (high comes before low for retracement)
+        if swing_high_idx >= swing_low_idx:
             return False
+        
+        # Calculate Fibonacci retracement levels
+        price_range = swing_high - swing_low
+        fib_382 = swing_high - (price_range * 0.382)
+        fib_500 = swing_high - (price_range * 0.500)
+        fib_618 = swing_high - (price_range * 0.618)
+        
+        # Current price
+        current_price = close[-1]
+        
+        # Check if current price is within the specified retracement range
+        target_min_level = swing_high - (price_range * min_retracement / 100)
+        target_max_level = swing_high - (price_range * max_retracement / 100)
+        
+        # Check if price is near any Fibonacci level within tolerance
+        tolerance_range = price_range * tolerance / 100
+        
+        near_382 = abs(current_price - fib_382) <= tolerance_range
+        near_500 = abs(current_price - fib_500) <= tolerance_range
+        near_618 = abs(current_price - fib_618) <= tolerance_range
+        
+        # Price should be within the target retracement range and near a Fib level
+        in_range = target_max_level <= current_price <= target_min_level
+        near_fib_level = near_382 or near_500 or near_618
+        
+        return in_range and near_fib_level
     
-    def _detect_harmonic_pattern(self, data, pattern_type, tolerance, lookback_period):
+    def _detect_harmonic_pattern(self, close, pattern_type, tolerance, lookback_period):
         """Detect harmonic patterns (simplified implementation)"""
-        try:
-            if len(data) < lookback_period or lookback_period < 20:
-                return False
-            
-            # Get recent data for pattern analysis
-            recent_data = data.tail(lookback_period)
-            closes = recent_data['close']
-            highs = recent_data['high']
-            lows = recent_data['low']
-            
-            # Find significant swing points
-            swing_points = self._find_swing_points(closes, window=5)
-            
-            if len(swing_points) < 5:  # Need at least 5 points for harmonic patterns
-                return False
-            
-            # Get last 5 swing points (X, A, B, C, D pattern)
-            points = swing_points[-5:]
-            
-            if pattern_type == "Otomatik":
-                # Check for any harmonic pattern
-                return (self._check_gartley_pattern(points, tolerance) or
-                        self._check_bat_pattern(points, tolerance) or
-                        self._check_butterfly_pattern(points, tolerance) or
-                        self._check_crab_pattern(points, tolerance))
-            elif pattern_type == "Gartley":
-                return self._check_gartley_pattern(points, tolerance)
-            elif pattern_type == "Bat":
-                return self._check_bat_pattern(points, tolerance)
-            elif pattern_type == "Butterfly":
-                return self._check_butterfly_pattern(points, tolerance)
-            elif pattern_type == "Crab":
-                return self._check_crab_pattern(points, tolerance)
-            
+        if len(close) < lookback_period or lookback_period < 20:
             return False
-            
-        except Exception as e:
-            print(f"Error detecting harmonic pattern: {str(e)}")
+        
+        # "Otomatik" checks for any harmonic pattern; a named one only tests its own row
+        if pattern_type == "Otomatik":
+            patterns = slice(None)
+        elif pattern_type in _HARMONIC_PATTERNS:
+            index = _HARMONIC_PATTERNS.index(pattern_type)
+            patterns = slice(index, index + 1)
+        else:
+            return False
+        
+        # Get recent closes for pattern analysis
+        closes = close[-lookback_period:]
+        
+        # Find significant swing points
+        swing_prices = self._find_swing_points(closes, window=5)
+        
+        if len(swing_prices) < 5:  # Need at least 5 points for harmonic patterns
             return False
+        
+        # Last 5 swing points (X, A, B, C, D pattern) as a one-row candidate batch
+        matches = self._check_harmonics_batch(swing_prices[None, -5:], tolerance / 100, patterns)
+        return bool(matches.any())
     
     def _find_swing_points(self, prices, window=5):
-        """Find swing highs and lows in price data"""
-        try:
-            swing_points = []
-            
-            for i in range(window, len(prices) - window):
-                # Check for swing high
-                is_high = all(prices.iloc[i] >= prices.iloc[j] for j in range(i-window, i+window+1) if j != i)
-                # Check for swing low  
-                is_low = all(prices.iloc[i] <= prices.iloc[j] for j in range(i-window, i+window+1) if j != i)
-                
-                if is_high or is_low:
-                    swing_points.append({
-                        'index': i,
-                        'price': prices.iloc[i],
-                        'type': 'high' if is_high else 'low'
-                    })
-            
-            return swing_points
-            
-        except Exception as e:
-            print(f"Error finding swing points: {str(e)}")
-            return []
-    
-    def _check_gartley_pattern(self, points, tolerance):
-        """Check for Gartley pattern (0.618 AB=CD, 0.786 XA retracement)"""
-        try:
-            if len(points) < 5:
-                return False
-            
-            # Extract points (X, A, B, C, D)
-            X, A, B, C, D = [p['price'] for p in points]
-            
-            # Gartley ratios
-            AB_XA = abs(B - A) / abs(A - X) if abs(A - X) > 0 else 0
-            BC_AB = abs(C - B) / abs(B - A) if abs(B - A) > 0 else 0
-            CD_BC = abs(D - C) / abs(C - B) if abs(C - B) > 0 else 0
-            AD_XA = abs(D - A) / abs(A - X) if abs(A - X) > 0 else 0
-            
-            # Target ratios for Gartley
-            target_AB_XA = 0.618
-            target_BC_AB = 0.382  # or 0.886
-            target_CD_BC = 1.272  # or 1.618
-            target_AD_XA = 0.786
-            
-            # Check ratios within tolerance
-            tolerance_ratio = tolerance / 100
-            
-            ab_check = abs(AB_XA - target_AB_XA) <= tolerance_ratio
-            bc_check = abs(BC_AB - 0.382) <= tolerance_ratio or abs(BC_AB - 0.886) <= tolerance_ratio
-            cd_check = abs(CD_BC - 1.272) <= tolerance_ratio or abs(CD_BC - 1.618) <= tolerance_ratio
-            ad_check = abs(AD_XA - target_AD_XA) <= tolerance_ratio
-            
-            return ab_check and bc_check and cd_check and ad_check
-            
-        except Exception as e:
-            print(f"Error checking Gartley pattern: {str(e)}")
-            return False
+        """Prices of the swing highs and lows in price data, in bar order"""
+        arr = np.asarray(prices, dtype=np.float64)
+        if len(arr) < 2 * window + 1:
+            return np.empty(0)
+        win = sliding_window_view(arr, 2 * window + 1)
+        center = arr[window:len(arr) - window]
+        
+        # Swing high/low: center equals the max/min of its window (ties allowed)
+        is_swing = (center == win.max(axis=1)) | (center == win.min(axis=1))
+        return center[is_swing]
     
-    def _check_bat_pattern(self, points, tolerance):
-        """Check for Bat pattern (0.382/0.500 AB=CD, 0.886 XA retracement)"""
-        try:
-            if len(points) < 5:
-                return False
-            
-            X, A, B, C, D = [p['price'] for p in points]
-            
-            AB_XA = abs(B - A) / abs(A - X) if abs(A - X) > 0 else 0
-            AD_XA = abs(D - A) / abs(A - X) if abs(A - X) > 0 else 0
-            
-            target_AB_XA = 0.382  # or 0.500
-            target_AD_XA = 0.886
-            
-            tolerance_ratio = tolerance / 100
-            
-            ab_check = abs(AB_XA - 0.382) <= tolerance_ratio or abs(AB_XA - 0.500) <= tolerance_ratio
-            ad_check = abs(AD_XA - target_AD_XA) <= tolerance_ratio
-            
-            return ab_check and ad_check
-            
-        except Exception as e:
-            print(f"Error checking Bat pattern: {str(e)}")
-            return False
+    def _compute_harmonic_ratios(self, points):
+        """AB/XA, BC/AB, CD/BC and AD/XA leg ratios for an (..., 5) array of X, A, B, C, D prices"""
+        X, A, B, C, D = np.moveaxis(np.asarray(points, dtype=np.float64), -1, 0)
+        
+        XA = np.abs(A - X)
+        AB = np.abs(B - A)
+        BC = np.abs(C - B)
+        
+        # Zero-length legs give a 0 ratio instead of dividing by zero
+        def leg_ratio(leg, base):
+            return np.divide(leg, base, out=np.zeros_like(leg), where=base > 0)
+        
+        # XA is the base of two ratios, so invert it once and multiply
+        inv_XA = leg_ratio(np.ones_like(XA), XA)
+        
+        return np.stack([
+            AB * inv_XA,
+            leg_ratio(BC, AB),
+            leg_ratio(np.abs(D - C), BC),
+            np.abs(D - A) * inv_XA,
+        ], axis=-1)
     
-    def _check_butterfly_pattern(self, points, tolerance):
-        """Check for Butterfly pattern (0.786 AB=CD, 1.272 XA extension)"""
-        try:
-            if len(points) < 5:
-                return False
-            
-            X, A, B, C, D = [p['price'] for p in points]
-            
-            AB_XA = abs(B - A) / abs(A - X) if abs(A - X) > 0 else 0
-            AD_XA = abs(D - A) / abs(A - X) if abs(A - X) > 0 else 0
-            
-            target_AB_XA = 0.786
-            target_AD_XA = 1.272  # or 1.618
-            
-            tolerance_ratio = tolerance / 100
-            
-            ab_check = abs(AB_XA - target_AB_XA) <= tolerance_ratio
-            ad_check = abs(AD_XA - 1.272) <= tolerance_ratio or abs(AD_XA - 1.618) <= tolerance_ratio
-            
-            return ab_check and ad_check
-            
-        except Exception as e:
-            print(f"Error checking Butterfly pattern: {str(e)}")
-            return False
+    def _match_harmonics(self, ratios, tolerance_ratio, patterns=slice(None)):
+        """Test leg ratios against the selected rows of _HARMONIC_TARGETS at once; one bool per pattern"""
+        ratios = np.asarray(ratios, dtype=np.float64)
+        targets = _HARMONIC_TARGETS[patterns]
+        # A leg passes when its closest accepted ratio is within tolerance (NaN pads never pass)
+        nearest = np.fmin.reduce(np.abs(ratios[..., None, :, None] - targets), axis=-1)
+        return ((nearest <= tolerance_ratio) | _HARMONIC_FREE_LEGS[patterns]).all(axis=-1)
     
-    def _check_crab_pattern(self, points, tolerance):
-        """Check for Crab pattern (0.382/0.618 AB=CD, 1.618 XA extension)"""
-        try:
-            if len(points) < 5:
-                return False
-            
-            X, A, B, C, D = [p['price'] for p in points]
-            
-            AB_XA = abs(B - A) / abs(A - X) if abs(A - X) > 0 else 0
-            AD_XA = abs(D - A) / abs(A - X) if abs(A - X) > 0 else 0
-            
-            target_AB_XA = 0.382  # or 0.618
-            target_AD_XA = 1.618
-            
-            tolerance_ratio = tolerance / 100
-            
-            ab_check = abs(AB_XA - 0.382) <= tolerance_ratio or abs(AB_XA - 0.618) <= tolerance_ratio
-            ad_check = abs(AD_XA - target_AD_XA) <= tolerance_ratio
-            
-            return ab_check and ad_check
-            
-        except Exception as e:
-            print(f"Error checking Crab pattern: {str(e)}")
-            return False
+    def _check_harmonics_batch(self, prices_arr, tolerance_ratio, patterns=slice(None)):
+        """Match an (n, 5) array of XABCD candidates against the selected patterns; (n, n_patterns) bools"""
+        return self._match_harmonics(self._compute_harmonic_ratios(prices_arr), tolerance_ratio, patterns)
     
-    def _check_fibonacci_support(self, data, lookback_period, min_retracement, max_retracement, tolerance):
+    def _check_fibonacci_support(self, close, low, lookback_period, min_retracement, max_retracement, tolerance):
         """Check if price is finding support at Fibonacci levels"""
-        try:
-            if len(data) < lookback_period + 5:
-                return False
-            
-            # Use recent data to check for support confirmation
-            recent_data = data.tail(10)  # Last 10 days
-            lows = recent_data['low']
-            closes = recent_data['close']
-            
-            # Check for higher lows (support forming)
-            recent_lows = lows.tail(5).values
-            
-            # Simple check: are recent lows trending higher?
-            higher_lows = all(recent_lows[i] >= recent_lows[i-1] for i in range(1, len(recent_lows)))
-            
-            # Check if current price is above recent low
-            current_price = closes.iloc[-1]
-            recent_low = lows.min()
-            price_recovery = current_price > recent_low * 1.01  # 1% above recent low
-            
-            return higher_lows and price_recovery
-            
-        except Exception as e:
-            print(f"Error checking Fibonacci support: {str(e)}")
+        if len(close) < lookback_period + 5:
+            return False
+        
+        # Use recent data to check for support confirmation
+        lows = low[-10:]  # Last 10 days
+        
+        # Check for higher lows (support forming)
+        recent_lows = lows[-5:]
+        
+        # Simple check: are recent lows trending higher?
+        if not np.all(np.diff(recent_lows) >= 0):
             return False
+        
+        # Check if current price is above recent low
+        return bool(close[-1] > lows.min() * 1.01)  # 1% above recent low
     
     def _calculate_trend(self, values):
         """Calculate trend direction from array of values"""
         if len(values) < 2:
             return "Belirsiz"
         
-        # Calculate simple trend
-        increases = 0
-        decreases = 0
-        
-        for i in range(1, len(values)):
-            if values[i] > values[i-1]:
-                increases += 1
-            elif values[i] < values[i-1]:
-                decreases += 1
+        # Count rising vs falling steps
+        steps = np.diff(np.asarray(values, dtype=np.float64))
+        if steps.size > 64:
+            # Long series: pack each direction mask into bits and popcount it
+            increases = int.from_bytes(np.packbits(steps > 0).tobytes(), 'big').bit_count()
+            decreases = int.from_bytes(np.packbits(steps < 0).tobytes(), 'big').bit_count()
+        else:
+            increases = int((steps > 0).sum())
+            decreases = int((steps < 0).sum())
         
         if increases > decreases:
             return "Yükseliş"
@@ -1411,27 +1544,141 @@ class BISTVolumeAnalyzer:
         Returns:
             list: Analysis results for stocks meeting criteria
         """
-        results = []
+        # scan_all runs the per-symbol analyses on a thread pool
+        results = [
+            analysis for analysis in self.scan_all(symbols, period=period, interval=interval, sma_period=sma_period)
+            if analysis['volume_ratio'] >= min_volume_ratio
+        ]
         
-        for symbol in symbols:
-            try:
-                analysis = self.analyze_stock_volume(symbol, period, interval, sma_period)
-                
-                if analysis and analysis['volume_ratio'] >= min_volume_ratio:
-                    results.append(analysis)
-                
-                # Rate limiting
-                time.sleep(0.1)
-                
-            except Exception as e:
-                print(f"Error in batch analysis for {symbol}: {str(e)}")
-                continue
+        # scan_all yields in completion order; restore input order so ties sort deterministically
+        position = {}
+        for pos, symbol in enumerate(symbols):
+            position.setdefault(symbol, pos)
+        results.sort(key=lambda x: position[x['symbol']])
         
         # Sort by volume ratio descending
         results.sort(key=lambda x: x['volume_ratio'], reverse=True)
         
         return results
     
+    def scan_all(self, symbols, max_workers=8, **kwargs):
+        """
+        Run analyze_stock_volume for many symbols concurrently
+        
+        Args:
+            symbols (list): List of stock symbols
+            max_workers (int): Number of worker threads
+            **kwargs: Passed through to analyze_stock_volume
+        
+        Yields:
+            dict: Analysis results in completion order (failed symbols are skipped)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.analyze_stock_volume, symbol, **kwargs): symbol for symbol in symbols}
+            for future in as_completed(futures):
+                try:
+                    analysis = future.result()
+                except Exception as e:
+                    logger.warning("Error in scan for %s: %s", futures[future], e)
+                    continue
+                if analysis:
+                    yield analysis
+    
+    def analyze_batch(self, symbols, period='5d', interval='1d', sma_period=10, ema_short=50, ema_long=200,
+                      rsi_period=14, vwap_period=20, bb_period=20, bb_std_dev=2.0, squeeze_period=6,
+                      squeeze_percentile=10):
+        """
+        Analyze many stocks at once on a symbol x bar NumPy panel
+        
+        Indicators are computed for all symbols in one kernel call per
+        indicator instead of building pandas Series per symbol.
+        
+        Args:
+            symbols (list): List of stock symbols
+            period (str): Time period
+            interval (str): Data interval
+            sma_period (int): Volume SMA period
+            ema_short (int): Short EMA period
+            ema_long (int): Long EMA period
+            rsi_period (int): RSI calculation period
+            vwap_period (int): VWAP calculation period
+            bb_period (int): Bollinger Bands period
+            bb_std_dev (float): Bollinger Bands standard deviation multiplier
+            squeeze_period (int): Squeeze lookback in months
+            squeeze_percentile (int): Band width percentile that counts as a squeeze
+            
+        Returns:
+            list: Core indicator snapshot per symbol with enough data
+        """
+        frames = self.data_fetcher.get_multiple_stocks_data(symbols, period, interval)
+        frames = {symbol: df for symbol, df in frames.items() if df is not None and len(df) >= sma_period}
+        if not frames:
+            return []
+        
+        names = list(frames)
+        # Prices are float32 to halve the panel's memory traffic; volume stays float64
+        # because the cumulative OBV/VWAP sums would lose precision in float32
+        panel, starts = self._build_panel(
+            [frames[s] for s in names], ['high', 'low', 'close', 'volume'],
+            dtypes={'high': np.float32, 'low': np.float32, 'close': np.float32}
+        )
+        close = panel['close']
+        volume = panel['volume']
+        lengths = close.shape[1] - starts
+        
+        ema_short_panel = _indicators.ema_2d(close, starts, ema_short)
+        ema_long_panel = _indicators.ema_2d(close, starts, ema_long)
+        
+        # RSI, VWAP, OBV and the Bollinger squeeze for every symbol in one parallel kernel pass
+        params = np.array([rsi_period, vwap_period, bb_period, bb_std_dev,
+                           squeeze_period * 22, squeeze_percentile], dtype=np.float64)
+        snapshot = _indicators.scan_array(panel['high'], panel['low'], close, volume, starts, params)
+        rsi_col, vwap_col, obv_col, upper_col, squeeze_col = snapshot.T
+        
+        # Every row has at least sma_period valid bars, so the tail window has no padding
+        volume_sma = volume[:, -sma_period:].mean(axis=1)
+        current_volume = volume[:, -1]
+        golden_cross = (ema_short_panel[:, -1] > ema_long_panel[:, -1]) & (lengths >= max(ema_short, ema_long) + 5)
+        
+        results = []
+        now = datetime.now()
+        for i, symbol in enumerate(names):
+            if np.isnan(volume_sma[i]) or volume_sma[i] == 0:
+                continue
+            results.append({
+                'symbol': symbol,
+                'current_volume': float(current_volume[i]),
+                'volume_sma': float(volume_sma[i]),
+                'volume_ratio': float(current_volume[i] / volume_sma[i]),
+                'current_price': float(close[i, -1]),
+                'ema_short': float(ema_short_panel[i, -1]),
+                'ema_long': float(ema_long_panel[i, -1]),
+                'golden_cross': bool(golden_cross[i]),
+                'rsi': float(rsi_col[i]),
+                'vwap': float(vwap_col[i]),
+                'obv': float(obv_col[i]),
+                'bb_upper': float(upper_col[i]),
+                'bb_squeeze_detected': bool(squeeze_col[i] == 1.0),
+                'data_points': int(lengths[i]),
+                'last_update': now
+            })
+        
+        return results
+    
+    def _build_panel(self, frames, columns, dtypes=None):
+        """Stack per-symbol frames into right-aligned, NaN-padded (n_symbols, n_bars) arrays"""
+        dtypes = dtypes or {}
+        n_bars = max(len(df) for df in frames)
+        starts = np.array([n_bars - len(df) for df in frames], dtype=np.int64)
+        panel = {}
+        for col in columns:
+            dtype = dtypes.get(col, np.float64)
+            values = np.full((len(frames), n_bars), np.nan, dtype=dtype)
+            for row, df in enumerate(frames):
+                values[row, starts[row]:] = df[col].to_numpy(dtype=dtype)
+            panel[col] = values
+        return panel, starts
+    
     def get_summary_stats(self, analyses):
         """Get summary statistics from analyses"""
         if not analyses:
@@ -1447,96 +1694,94 @@ class BISTVolumeAnalyzer:
             'median_volume_ratio': np.median(volume_ratios)
         }
     
-    def get_fundamental_data(self, symbol, period='1y'):
-        """Get fundamental data for a stock using yfinance"""
+    def get_fundamental_data(self, symbol, period='1y', data=None):
+        """Get fundamental data for a stock using yfinance; `data` reuses an already fetched price history"""
         try:
             # Get historical data
-            data = self.data_fetcher.get_stock_data(symbol, period)
+            if data is None:
+                data = self.data_fetcher.get_stock_data(symbol, period)
             if data is None or data.empty:
-                print(f"No historical data available for {symbol}")
+                logger.debug("%s: No historical data available", symbol)
                 return None
 
-            # Calculate basic metrics
-            current_price = data['close'].iloc[-1]
+            # Calculate basic metrics on raw arrays
+            close = data['close'].to_numpy(dtype=np.float64)
+            volume = data['volume'].to_numpy(dtype=np.float64)
+            n = len(close)
+            current_price = close[-1]
             market_data = {
                 'symbol': symbol,
                 'current_price': current_price,
-                'volume': data['volume'].iloc[-1],
-                'avg_volume': data['volume'].mean(),
-                'price_change_1m': ((current_price - data['close'].iloc[-22]) / data['close'].iloc[-22] * 100) if len(data) > 22 else 0,
-                'price_change_3m': ((current_price - data['close'].iloc[-66]) / data['close'].iloc[-66] * 100) if len(data) > 66 else 0,
-                'price_change_6m': ((current_price - data['close'].iloc[-132]) / data['close'].iloc[-132] * 100) if len(data) > 132 else 0,
-                'volatility': data['close'].pct_change().std() * 100,
+                'volume': volume[-1],
+                'avg_volume': volume.mean(),
+                'price_change_1m': ((current_price - close[-22]) / close[-22] * 100) if n > 22 else 0,
+                'price_change_3m': ((current_price - close[-66]) / close[-66] * 100) if n > 66 else 0,
+                'price_change_6m': ((current_price - close[-132]) / close[-132] * 100) if n > 132 else 0,
+                'volatility': np.std(np.diff(close) / close[:-1], ddof=1) * 100 if n > 2 else np.nan,
             }
             
             # Calculate technical indicators
-            market_data['rsi'] = self._calculate_rsi(data['close'])
+            market_data['rsi'] = self._calculate_rsi(close)
 
             # Try to get real fundamental data from Yahoo Finance
             try:
-                import yfinance as yf
-                yf_symbol = f"{symbol}.IS" if not symbol.endswith('.IS') else symbol
-                ticker = yf.Ticker(yf_symbol)
-                
-                info = ticker.info
+                _, info = self._get_info(symbol)
+                iget = info.get
                 
                 # P/E Ratio - Strict Check
-                pe_ratio = info.get('trailingPE') or info.get('forwardPE')
+                pe_ratio = iget('trailingPE') or iget('forwardPE')
                 if pe_ratio and 0 < pe_ratio < 1000:
                     market_data['pe_ratio'] = pe_ratio
-                    print(f"✅ {symbol}: Gerçek P/E bulundu: {pe_ratio:.1f}")
+                    logger.debug("✅ %s: Gerçek P/E bulundu: %.1f", symbol, pe_ratio)
                 else:
-                    print(f"❌ {symbol}: Gerçek P/E verisi bulunamadı, hisse atlanıyor.")
+                    logger.debug("❌ %s: Gerçek P/E verisi bulunamadı, hisse atlanıyor.", symbol)
                     return None
 
                 # P/B Ratio - Strict Check
-                pb_ratio = info.get('priceToBook')
+                pb_ratio = iget('priceToBook')
                 if pb_ratio and 0 < pb_ratio < 100:
                     market_data['pb_ratio'] = pb_ratio
-                    print(f"✅ {symbol}: Gerçek P/B bulundu: {pb_ratio:.2f}")
+                    logger.debug("✅ %s: Gerçek P/B bulundu: %.2f", symbol, pb_ratio)
                 else:
-                    print(f"❌ {symbol}: Gerçek P/B verisi bulunamadı, hisse atlanıyor.")
+                    logger.debug("❌ %s: Gerçek P/B verisi bulunamadı, hisse atlanıyor.", symbol)
                     return None
 
                 # Market Cap
-                market_cap = info.get('marketCap')
+                market_cap = iget('marketCap')
                 if market_cap and market_cap > 0:
                     market_data['market_cap_est'] = market_cap
                 else:
                     market_data['market_cap_est'] = current_price * 1000000  # Estimated
 
                 # Other financial ratios - if not found, use a default value or skip
-                market_data['roe'] = info.get('returnOnEquity') or 0
-                market_data['debt_equity_ratio'] = info.get('debtToEquity') or 0
-                market_data['revenue_growth'] = info.get('revenueGrowth') or 0
-                market_data['profit_margin'] = info.get('profitMargins') or 0
-                market_data['dividend_yield'] = (info.get('dividendYield') or 0) * 100
+                market_data['roe'] = iget('returnOnEquity') or 0
+                market_data['debt_equity_ratio'] = iget('debtToEquity') or 0
+                market_data['revenue_growth'] = iget('revenueGrowth') or 0
+                market_data['profit_margin'] = iget('profitMargins') or 0
+                market_data['dividend_yield'] = (iget('dividendYield') or 0) * 100
 
             except Exception as e:
-                print(f"❌ {symbol}: Yahoo Finance hatası: {e}. Hisse atlanıyor.")
+                logger.warning("❌ %s: Yahoo Finance hatası: %s. Hisse atlanıyor.", symbol, e)
                 return None
             
             return market_data
             
         except Exception as e:
-            print(f"Error getting fundamental data for {symbol}: {e}")
+            logger.warning("Error getting fundamental data for %s: %s", symbol, e)
             return None
     
     def _calculate_rsi(self, prices, period=14):
         """Calculate RSI indicator"""
         try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi.iloc[-1] if not rsi.empty else 50
+            if len(prices) == 0:
+                return 50
+            return float(_indicators.rsi(np.asarray(prices, dtype=np.float64), period)[-1])
         except:
             return 50
 
     def _ema(self, series, span):
         try:
-            return series.ewm(span=span, adjust=False).mean()
+            return pd.Series(_indicators.ema(series.to_numpy(dtype=np.float64), span), index=series.index)
         except Exception:
             return None
 
@@ -1556,26 +1801,71 @@ class BISTVolumeAnalyzer:
 
     def _sma(self, series, window):
         try:
-            return series.rolling(window=window).mean()
+            return pd.Series(_indicators.sma(series.to_numpy(dtype=np.float64), window), index=series.index)
         except Exception:
             return None
 
+    def _get_info(self, symbol):
+        """Return the cached (yf.Ticker, info dict) pair for a symbol, fetching it on first use"""
+        with self._info_lock:
+            cached = self._info_cache.get(symbol)
+        if cached is None:
+            import yfinance as yf
+            # Creating the Ticker is cheap; only .info goes to the network
+            ticker = yf.Ticker(to_yf_symbol(symbol))
+            info = self._load_fundamentals_cache(symbol, 'info')
+            if info is None:
+                info = ticker.info
+                if info:
+                    self._save_fundamentals_cache(symbol, 'info', info)
+            with self._info_lock:
+                cached = self._info_cache.setdefault(symbol, (ticker, info))
+        return cached
+
     def _get_financial_frames(self, symbol):
         """Fetch annual income, balance, cashflow, dividends using yfinance."""
         try:
-            import yfinance as yf
-            yf_symbol = f"{symbol}.IS" if not symbol.endswith('.IS') else symbol
-            t = yf.Ticker(yf_symbol)
+            frames = self._load_fundamentals_cache(symbol, 'frames')
+            if frames is not None:
+                return frames
+            t, _ = self._get_info(symbol)
             # In yfinance>=0.2, properties return DataFrames with columns as periods
             income = getattr(t, 'income_stmt', None)
             balance = getattr(t, 'balance_sheet', None)
             cashflow = getattr(t, 'cashflow', None)
             dividends = getattr(t, 'dividends', None)
-            return income, balance, cashflow, dividends
+            frames = (income, balance, cashflow, dividends)
+            if any(frame is not None for frame in frames):
+                self._save_fundamentals_cache(symbol, 'frames', frames)
+            return frames
         except Exception as e:
-            print(f"{symbol}: Finansal tablolar alınamadı: {e}")
+            logger.warning("%s: Finansal tablolar alınamadı: %s", symbol, e)
             return None, None, None, None
 
+    def _load_fundamentals_cache(self, symbol, kind):
+        """Load a cached fundamentals entry ('info' or 'frames'); None if missing, unreadable or stale"""
+        path = os.path.join(_FUNDAMENTALS_CACHE_DIR, f"{symbol}.{kind}.pkl")
+        try:
+            if not os.path.exists(path) or time.time() - os.path.getmtime(path) >= _FUNDAMENTALS_CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("%s: Temel veri önbelleği okunamadı: %s", symbol, e)
+            return None
+
+    def _save_fundamentals_cache(self, symbol, kind, value):
+        """Persist a fundamentals entry; written to a temp file first so concurrent readers never see a partial file"""
+        path = os.path.join(_FUNDAMENTALS_CACHE_DIR, f"{symbol}.{kind}.pkl")
+        try:
+            os.makedirs(_FUNDAMENTALS_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("%s: Temel veri önbelleği yazılamadı: %s", symbol, e)
+
     def _last_n_annual(self, df, keys, n=4):
         """Get last n annual values for the first matching key in keys list."""
         try:
@@ -1613,68 +1903,50 @@ class BISTVolumeAnalyzer:
         try:
             if not series_vals or len(series_vals) < 3:
                 return None
-            growths = []
-            for i in range(1, len(series_vals)):
-                prev, cur = series_vals[i-1], series_vals[i]
-                if prev and abs(prev) > 1e-6:
-                    growths.append((cur - prev) / abs(prev))
-            if not growths:
+            arr = np.asarray(series_vals, dtype=np.float64)
+            prev, cur = arr[:-1], arr[1:]
+            # Skip years with a (near) zero or missing base
+            mask = np.abs(prev) > 1e-6
+            if not mask.any():
                 return None
-            return float(np.mean(growths) * 100.0)
+            growths = (cur[mask] - prev[mask]) / np.abs(prev[mask])
+            return float(growths.mean() * 100.0)
         except Exception:
             return None
 
-    def analyze_single_stock(self, symbol, period='1y', scoring_params=None):
+    def analyze_single_stock(self, symbol, period='1y', scoring_params=None, data=None):
         """Analyze a single BIST stock with fundamental (max 20) and technical (max 10) criteria.
         Returns dict with detailed scoring and recommendation.
         
         Args:
             symbol: Stock symbol to analyze
             period: Data period
-            scoring_params: Dict with custom thresholds from UI
+            scoring_params: Dict with custom thresholds from UI, or a resolved ScoringThresholds
+            data: Optional pre-fetched price history (skips the per-symbol download)
         """
-        # Default scoring parameters if not provided
-        if scoring_params is None:
-            scoring_params = {}
-        
-        # Set default thresholds
-        pe_excellent = scoring_params.get('pe_excellent', 8.0)
-        pe_good = scoring_params.get('pe_good', 15.0)
-        pb_excellent = scoring_params.get('pb_excellent', 1.0)
-        pb_good = scoring_params.get('pb_good', 2.0)
-        roe_excellent = scoring_params.get('roe_excellent', 15.0)
-        roe_good = scoring_params.get('roe_good', 10.0)
-        margin_excellent = scoring_params.get('margin_excellent', 10.0)
-        margin_good = scoring_params.get('margin_good', 5.0)
-        debt_excellent = scoring_params.get('debt_excellent', 1.0)
-        debt_good = scoring_params.get('debt_good', 2.0)
-        rsi_good_min = scoring_params.get('rsi_good_min', 40.0)
-        rsi_good_max = scoring_params.get('rsi_good_max', 60.0)
-        sma_tolerance = scoring_params.get('sma_tolerance', 2.0)
-        volume_multiplier = scoring_params.get('volume_multiplier', 1.2)
-        macd_tolerance = scoring_params.get('macd_tolerance', 0.01)
+        # Thresholds with defaults filled in (already resolved when called from a batch scan)
+        limits = ScoringThresholds.from_params(scoring_params)
         
+        # Fetch price history once; it feeds both the fundamental snapshot and the technicals
+        if data is None:
+            data = self.data_fetcher.get_stock_data(symbol, period)
+
         # Fetch base market and fundamental snapshot (uses strict real data for P/E & P/B)
-        fundamentals = self.get_fundamental_data(symbol, period)
+        fundamentals = self.get_fundamental_data(symbol, period, data=data)
         if not fundamentals:
             return None
 
-        # Fetch price history for technicals
-        data = self.data_fetcher.get_stock_data(symbol, period)
         if data is None or data.empty or len(data) < 50:
-            print(f"{symbol}: Yetersiz fiyat verisi")
+            logger.debug("%s: Yetersiz fiyat verisi", symbol)
             return None
 
-        close = data['close']
-        volume = data['volume']
-        current_price = close.iloc[-1]
+        close = data['close'].to_numpy(dtype=np.float64)
+        volume = data['volume'].to_numpy(dtype=np.float64)
+        current_price = close[-1]
+        current_volume = volume[-1]
 
-        # Technical indicators
-        sma50 = self._sma(close, 50)
-        sma200 = self._sma(close, 200) if len(close) >= 200 else None
-        rsi = self._calculate_rsi(close)
-        macd_line, macd_signal, macd_hist = self._macd(close)
-        vol20 = volume.rolling(20).mean()
+        # Technical indicators (latest values only, one kernel call)
+        sma50, sma200, rsi, macd_line, macd_signal, macd_hist, vol20 = _indicators.compute_indicators(close, volume)
 
         # Fundamental additional metrics
         income, balance, cashflow, dividends = self._get_financial_frames(symbol)
@@ -1691,9 +1963,7 @@ class BISTVolumeAnalyzer:
         # EV/EBITDA (FD/FAVÖK)
         ev_ebitda = None
         try:
-            import yfinance as yf
-            yf_symbol = f"{symbol}.IS" if not symbol.endswith('.IS') else symbol
-            info = yf.Ticker(yf_symbol).info
+            _, info = self._get_info(symbol)
             ev_ebitda = info.get('enterpriseToEbitda')
             if not ev_ebitda:
                 ev = info.get('enterpriseValue')
@@ -1734,73 +2004,55 @@ class BISTVolumeAnalyzer:
             pass
 
         # --- Scoring ---
-        fundamental_points = 0
-        fundamental_breakdown = []
-
-        # Selected 10 criteria (max 20 pts)
-        # 1) P/E lower is better
+        # Selected 10 criteria (max 20 pts), one table row each: 2 pts past the
+        # excellent threshold, 1 pt past the good one
         pe = fundamentals.get('pe_ratio')
-        pe_pts = 2 if pe is not None and pe <= pe_excellent else (1 if pe is not None and pe <= pe_good else 0)
-        fundamental_points += pe_pts
-        fundamental_breakdown.append({'Kriter': 'F/K Oranı', 'Değer': pe, 'Puan': pe_pts})
-
-        # 2) P/B lower is better (<1 ideal)
         pb = fundamentals.get('pb_ratio')
-        pb_pts = 2 if pb is not None and pb < pb_excellent else (1 if pb is not None and pb <= pb_good else 0)
-        fundamental_points += pb_pts
-        fundamental_breakdown.append({'Kriter': 'PD/DD Oranı', 'Değer': pb, 'Puan': pb_pts})
-
-        # 3) EV/EBITDA
-        ev_ebitda_pts = 2 if ev_ebitda is not None and ev_ebitda < 6 else (1 if ev_ebitda is not None and ev_ebitda <= 8 else 0)
-        fundamental_points += ev_ebitda_pts
-        fundamental_breakdown.append({'Kriter': 'FD/FAVÖK', 'Değer': ev_ebitda, 'Puan': ev_ebitda_pts})
 
-        # 4) Net Profit Margin
+        # yfinance often returns margins and ROE as fractions
         npm = fundamentals.get('profit_margin')
-        npm_pct = npm * 100 if npm is not None and npm < 1 else npm  # yfinance often returns fraction
+        npm_pct = npm * 100 if npm is not None and npm < 1 else npm
         if npm_pct is None:
             npm_pct = 0
-        npm_pts = 2 if npm_pct >= margin_excellent else (1 if npm_pct >= margin_good else 0)
-        fundamental_points += npm_pts
-        fundamental_breakdown.append({'Kriter': 'Net Kâr Marjı (%)', 'Değer': npm_pct, 'Puan': npm_pts})
-
-        # 5) Sales Growth 3Y avg
-        sg = rev_growth_3y if rev_growth_3y is not None else 0
-        sg_pts = 2 if sg >= 10 else (1 if sg >= 5 else 0)
-        fundamental_points += sg_pts
-        fundamental_breakdown.append({'Kriter': 'Satış Büyümesi 3Y (%)', 'Değer': sg, 'Puan': sg_pts})
-
-        # 6) Net Profit Growth 3Y
-        ng = ni_growth_3y if ni_growth_3y is not None else 0
-        ng_pts = 2 if ng >= 10 else (1 if ng > 0 else 0)
-        fundamental_points += ng_pts
-        fundamental_breakdown.append({'Kriter': 'Net Kâr Büyümesi 3Y (%)', 'Değer': ng, 'Puan': ng_pts})
-
-        # 7) ROE
         roe = fundamentals.get('roe')
         roe_pct = roe * 100 if roe is not None and roe < 1 else roe
         if roe_pct is None:
             roe_pct = 0
-        roe_pts = 2 if roe_pct >= roe_excellent else (1 if roe_pct >= roe_good else 0)
-        fundamental_points += roe_pts
-        fundamental_breakdown.append({'Kriter': 'ROE (%)', 'Değer': roe_pct, 'Puan': roe_pts})
 
-        # 8) Debt/Equity
+        sg = rev_growth_3y if rev_growth_3y is not None else 0
+        ng = ni_growth_3y if ni_growth_3y is not None else 0
         de = fundamentals.get('debt_equity_ratio')
-        de_pts = 2 if de is not None and de < debt_excellent else (1 if de is not None and de <= debt_good else 0)
-        fundamental_points += de_pts
-        fundamental_breakdown.append({'Kriter': 'Borç/Özkaynak', 'Değer': de, 'Puan': de_pts})
-
-        # 9) Current Ratio
         cr = current_ratio if current_ratio is not None else 0
-        cr_pts = 2 if cr >= 1.5 else (1 if cr >= 1.0 else 0)
-        fundamental_points += cr_pts
-        fundamental_breakdown.append({'Kriter': 'Cari Oran', 'Değer': cr, 'Puan': cr_pts})
 
-        # 10) Operating Cash Flow
-        ocf_pts = 2 if ocf_last is not None and ocf_last > 0 and (ni_vals and ni_vals[-1] and ni_vals[-1] > 0) else (1 if ocf_last is not None and ocf_last > 0 else 0)
-        fundamental_points += ocf_pts
-        fundamental_breakdown.append({'Kriter': 'Faaliyet Nakit Akımı', 'Değer': ocf_last, 'Puan': ocf_pts})
+        # Operating cash flow scores 1 when positive, 2 when net income is positive too
+        ocf_positive = ocf_last is not None and ocf_last > 0
+        ocf_level = int(ocf_positive) + int(bool(ocf_positive and ni_vals and ni_vals[-1] and ni_vals[-1] > 0))
+
+        shown = (pe, pb, ev_ebitda, npm_pct, sg, ng, roe_pct, de, cr, ocf_last)
+        scored = np.array([pe, pb, ev_ebitda, npm_pct, sg, ng, roe_pct, de, cr, ocf_level], dtype=np.float64)
+        thresholds = np.array([
+            [limits.pe_excellent, limits.pe_good],
+            [limits.pb_excellent, limits.pb_good],
+            [6.0, 8.0],
+            [limits.margin_excellent, limits.margin_good],
+            [10.0, 5.0],
+            [10.0, 0.0],
+            [limits.roe_excellent, limits.roe_good],
+            [limits.debt_excellent, limits.debt_good],
+            [1.5, 1.0],
+            [2.0, 1.0],
+        ])
+
+        # Signed distance past each threshold; missing values (NaN) never pass
+        margin = _FUNDAMENTAL_DIRECTIONS[:, None] * (thresholds - scored[:, None])
+        passed = np.where(_FUNDAMENTAL_STRICT, margin > 0, margin >= 0)
+        points = np.where(passed[:, 0], 2, np.where(passed[:, 1], 1, 0))
+
+        fundamental_points = int(points.sum())
+        fundamental_breakdown = [
+            ScoreRow(label, value, pts)
+            for label, value, pts in zip(_FUNDAMENTAL_LABELS, shown, points.tolist())
+        ]
 
         # Fundamental cap at 20
         if fundamental_points > 20:
@@ -1811,41 +2063,41 @@ class BISTVolumeAnalyzer:
         technical_breakdown = []
 
         # Price above SMA200
-        if sma200 is not None and not np.isnan(sma200.iloc[-1]):
-            p200_pts = 2 if current_price > sma200.iloc[-1] else 0
+        if not np.isnan(sma200):
+            p200_pts = 2 if current_price > sma200 else 0
             technical_points += p200_pts
-            technical_breakdown.append({'Kriter': 'Fiyat > SMA200', 'Değer': f"{current_price:.2f} > {sma200.iloc[-1]:.2f}", 'Puan': p200_pts})
+            technical_breakdown.append(ScoreRow('Fiyat > SMA200', f"{current_price:.2f} > {sma200:.2f}", p200_pts))
         else:
-            technical_breakdown.append({'Kriter': 'Fiyat > SMA200', 'Değer': 'Veri yok', 'Puan': 0})
+            technical_breakdown.append(ScoreRow('Fiyat > SMA200', 'Veri yok', 0))
 
         # Price above SMA50
-        if sma50 is not None and not np.isnan(sma50.iloc[-1]):
-            p50_pts = 2 if current_price > sma50.iloc[-1] else 0
+        if not np.isnan(sma50):
+            p50_pts = 2 if current_price > sma50 else 0
             technical_points += p50_pts
-            technical_breakdown.append({'Kriter': 'Fiyat > SMA50', 'Değer': f"{current_price:.2f} > {sma50.iloc[-1]:.2f}", 'Puan': p50_pts})
+            technical_breakdown.append(ScoreRow('Fiyat > SMA50', f"{current_price:.2f} > {sma50:.2f}", p50_pts))
         else:
-            technical_breakdown.append({'Kriter': 'Fiyat > SMA50', 'Değer': 'Veri yok', 'Puan': 0})
+            technical_breakdown.append(ScoreRow('Fiyat > SMA50', 'Veri yok', 0))
 
         # RSI scoring
-        rsi_pts = 2 if rsi >= rsi_good_max else (1 if rsi_good_min <= rsi <= rsi_good_max else 0)
+        rsi_pts = 2 if rsi >= limits.rsi_good_max else (1 if limits.rsi_good_min <= rsi <= limits.rsi_good_max else 0)
         technical_points += rsi_pts
-        technical_breakdown.append({'Kriter': 'RSI(14)', 'Değer': f"{rsi:.1f}", 'Puan': rsi_pts})
+        technical_breakdown.append(ScoreRow('RSI(14)', f"{rsi:.1f}", rsi_pts))
 
         # MACD
-        if macd_line is not None and macd_signal is not None:
-            macd_pts = 2 if macd_line.iloc[-1] > macd_signal.iloc[-1] else 0
+        if not np.isnan(macd_line) and not np.isnan(macd_signal):
+            macd_pts = 2 if macd_line > macd_signal else 0
             technical_points += macd_pts
-            technical_breakdown.append({'Kriter': 'MACD', 'Değer': 'Pozitif' if macd_pts==2 else 'Negatif', 'Puan': macd_pts})
+            technical_breakdown.append(ScoreRow('MACD', 'Pozitif' if macd_pts==2 else 'Negatif', macd_pts))
         else:
-            technical_breakdown.append({'Kriter': 'MACD', 'Değer': 'Veri yok', 'Puan': 0})
+            technical_breakdown.append(ScoreRow('MACD', 'Veri yok', 0))
 
         # Volume vs 20-day average
-        if vol20 is not None and not np.isnan(vol20.iloc[-1]):
-            vol_pts = 2 if volume.iloc[-1] > (vol20.iloc[-1] * volume_multiplier) else 0
+        if not np.isnan(vol20):
+            vol_pts = 2 if current_volume > (vol20 * limits.volume_multiplier) else 0
             technical_points += vol_pts
-            technical_breakdown.append({'Kriter': 'Hacim > 20G Ort.', 'Değer': f"{volume.iloc[-1]:.0f} vs {vol20.iloc[-1]*volume_multiplier:.0f}", 'Puan': vol_pts})
+            technical_breakdown.append(ScoreRow('Hacim > 20G Ort.', f"{current_volume:.0f} vs {vol20*limits.volume_multiplier:.0f}", vol_pts))
         else:
-            technical_breakdown.append({'Kriter': 'Hacim > 20G Ort.', 'Değer': 'Veri yok', 'Puan': 0})
+            technical_breakdown.append(ScoreRow('Hacim > 20G Ort.', 'Veri yok', 0))
 
         total_points = fundamental_points + technical_points  # max 30
 
@@ -1861,21 +2113,20 @@ class BISTVolumeAnalyzer:
         else:
             reco = 'Güçlü Sat'
 
-        return {
-            'symbol': symbol,
-            'fundamental_points': fundamental_points,
-            'technical_points': technical_points,
-            'total_points': total_points,
-            'recommendation': reco,
-            'fundamental_breakdown': fundamental_breakdown,
-            'technical_breakdown': technical_breakdown,
-            'price': current_price,
-            # Useful fields for batch display
-            'pe_ratio': pe,
-            'pb_ratio': pb
-        }
+        return StockScore(
+            symbol=symbol,
+            fundamental_points=fundamental_points,
+            technical_points=technical_points,
+            total_points=total_points,
+            recommendation=reco,
+            fundamental_breakdown=fundamental_breakdown,
+            technical_breakdown=technical_breakdown,
+            price=current_price,
+            pe_ratio=pe,
+            pb_ratio=pb,
+        )
 
-    def analyze_stocks_comprehensive(self, period='1y', min_total_points=0, progress_callback=None, limit=None, sleep_sec=0.1, scoring_params=None):
+    def analyze_stocks_comprehensive(self, period='1y', min_total_points=0, progress_callback=None, limit=None, sleep_sec=0.1, scoring_params=None, max_workers=16):
         """Batch analyze all BIST stocks using the same 30-point scoring.
 
         Args:
@@ -1883,8 +2134,9 @@ class BISTVolumeAnalyzer:
             min_total_points (int): Minimum total points filter (0-30).
             progress_callback (callable): Optional progress reporter fn(i, total, symbol).
             limit (int|None): Optional max number of stocks to analyze (for quick tests).
-            sleep_sec (float): Throttle between requests.
+            sleep_sec (float): Minimum spacing between request starts across all workers.
             scoring_params (dict): Custom scoring parameters from UI controls.
+            max_workers (int): Number of worker threads.
 
         Returns:
             list[dict]: List of per-stock score summaries.
@@ -1896,213 +2148,142 @@ class BISTVolumeAnalyzer:
         total = len(stocks) if limit is None else min(limit, len(stocks))
         results = []
 
-        for idx, symbol in enumerate(stocks[:total], start=1):
-            try:
-                if progress_callback:
-                    progress_callback(idx, total, symbol)
+        # Price histories in batched downloads instead of one request per symbol
+        histories = self.data_fetcher.get_stocks_data_batch(stocks[:total], period, '1d')
 
-                res = self.analyze_single_stock(symbol, period, scoring_params=scoring_params)
-                if res and res.get('total_points', 0) >= min_total_points:
-                    results.append(res)
-            except Exception as e:
-                print(f"Comprehensive scan error on {symbol}: {e}")
-            finally:
+        limiter = _RateLimiter(sleep_sec)
+        # Resolve UI thresholds once for the whole scan
+        scoring_params = ScoringThresholds.from_params(scoring_params)
+
+        def analyze(symbol):
+            limiter.wait()
+            return self.analyze_single_stock(symbol, period, scoring_params=scoring_params,
+                                             data=histories.get(symbol))
+
+        # I/O-bound yfinance calls run on a thread pool; progress is reported from this thread
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(analyze, symbol): (pos, symbol) for pos, symbol in enumerate(stocks[:total])}
+            for idx, future in enumerate(as_completed(futures), start=1):
+                pos, symbol = futures[future]
                 try:
-                    time.sleep(sleep_sec)
-                except Exception:
-                    pass
+                    if progress_callback:
+                        progress_callback(idx, total, symbol)
+
+                    res = future.result()
+                    if res and res.total_points >= min_total_points:
+                        results.append((pos, res))
+                except Exception as e:
+                    logger.warning("Comprehensive scan error on %s: %s", symbol, e)
+
+        # Back to ticker list order so ties don't depend on which thread finished first
+        results = [res for _, res in sorted(results, key=lambda item: item[0])]
+
+        # Info is only reused within one scan; drop it so the next scan sees fresh data
+        self._info_cache.clear()
 
         # Sort by total points desc, then fundamental points desc
-        results.sort(key=lambda x: (x.get('total_points', 0), x.get('fundamental_points', 0)), reverse=True)
+        results.sort(key=lambda x: (x.total_points, x.fundamental_points), reverse=True)
         return results
     
-    def screen_stocks_fundamental(self, scan_type, params, progress_callback=None, restrict_symbols=None):
+    def screen_stocks_fundamental(self, scan_type, params, progress_callback=None, restrict_symbols=None, max_workers=16):
         """Screen stocks based on fundamental criteria with progress tracking"""
         try:
             stocks = restrict_symbols if restrict_symbols else self.get_bist_stocks()
             if not stocks:
                 return []
             
-            results = []
+            fetched = []
             total_stocks = len(stocks)
             scan_limit = total_stocks  # Scan all stocks, no limit
             
-            for i, symbol in enumerate(stocks[:scan_limit]):
-                try:
-                    # Progress callback for UI updates
-                    if progress_callback:
-                        progress_callback(i + 1, scan_limit, symbol)
-                    
-                    fundamental_data = self.get_fundamental_data(symbol, params.get('period', '1y'))
-                    if fundamental_data is None:
-                        continue
-                    
-                    # Apply filters based on scan type
-                    if self._passes_fundamental_criteria(fundamental_data, scan_type, params):
-                        results.append(fundamental_data)
-                        print(f"🎯 BULUNAN: {symbol} - Kriterleri karşılıyor!")
-                    else:
-                        # Debug: Show which criterion failed
-                        print(f"❌ {symbol}: Kriterleri karşılamıyor")
+            period = params.get('period', '1y')
+            limiter = _RateLimiter(0.1)
+            
+            def fetch(symbol):
+                limiter.wait()
+                return self.get_fundamental_data(symbol, period)
+            
+            # Fetch fundamentals concurrently; filtering and progress stay on this thread
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(fetch, symbol): (pos, symbol) for pos, symbol in enumerate(stocks[:scan_limit])}
+                for i, future in enumerate(as_completed(futures)):
+                    pos, symbol = futures[future]
+                    try:
+                        # Progress callback for UI updates
+                        if progress_callback:
+                            progress_callback(i + 1, scan_limit, symbol)
                         
-                except Exception as e:
-                    print(f"⚠️ {symbol}: Hata - {e}")
-                    continue
+                        fundamental_data = future.result()
+                        if fundamental_data is not None:
+                            fetched.append((pos, fundamental_data))
+                            
+                    except Exception as e:
+                        logger.warning("⚠️ %s: Hata - %s", symbol, e)
+                        continue
+            
+            if not fetched:
+                return []
+            # Back to ticker list order so ties and the top-50 cut don't depend on thread timing
+            fetched = [data for _, data in sorted(fetched, key=lambda item: item[0])]
+            
+            # Apply filters based on scan type to all fetched stocks at once, on columns
+            columns = _fundamental_columns(fetched)
+            passed = np.flatnonzero(self._passes_fundamental_criteria_batch(columns, scan_type, params))
+            if logger.isEnabledFor(logging.DEBUG):
+                # Build the symbol list only when debug output is actually emitted
+                logger.debug("🎯 BULUNAN (%s): %d/%d hisse kriterleri karşılıyor: %s",
+                             scan_type, len(passed), len(fetched), ', '.join(fetched[i]['symbol'] for i in passed))
             
             # Sort results based on scan type
-            results = self._sort_fundamental_results(results, scan_type)
+            order = self._sort_fundamental_results({k: v[passed] for k, v in columns.items()}, scan_type)
             
-            return results[:50]  # Return top 50 results instead of 20
+            # Row dicts are only picked out for the top 50 results instead of 20
+            return [fetched[i] for i in passed[order][:50]]
             
         except Exception as e:
-            print(f"Temel tarama hatası: {e}")
+            logger.error("Temel tarama hatası: %s", e)
             return []
     
-    def _passes_fundamental_criteria(self, data, scan_type, params):
-        """Check if stock passes fundamental screening criteria"""
-        try:
-            market_cap = data.get('market_cap_est', 0)
-            min_market_cap = params.get('min_market_cap', 100) * 1000000  # Convert to TL
-            max_market_cap = params.get('max_market_cap', 100000) * 1000000
-            
-            # Market cap filter
-            if market_cap < min_market_cap or market_cap > max_market_cap:
-                return False
-            
-            # Apply specific criteria based on scan type
-            if scan_type == 'low_pe':
-                pe_ratio = data.get('pe_ratio', 100)
-                min_pe = params.get('min_pe', 0)
-                max_pe = params.get('max_pe', 15)
-                result = min_pe <= pe_ratio <= max_pe
-                # Debug info
-                if result:
-                    print(f"✓ {data.get('symbol', 'UNKNOWN')}: P/E={pe_ratio:.1f} (aralık: {min_pe}-{max_pe})")
-                return result
-            
-            elif scan_type == 'high_roe':
-                roe = data.get('roe', 0)
-                min_roe = params.get('min_roe', 15)
-                max_roe = params.get('max_roe', 100)
-                return min_roe <= roe <= max_roe
-            
-            elif scan_type == 'low_pb':
-                pb_ratio = data.get('pb_ratio', 100)
-                min_pb = params.get('min_pb', 0)
-                max_pb = params.get('max_pb', 2)
-                return min_pb <= pb_ratio <= max_pb
-            
-            elif scan_type == 'dividend':
-                dividend_yield = data.get('dividend_yield', 0)
-                min_dividend = params.get('min_dividend', 3)
-                max_dividend = params.get('max_dividend', 20)
-                return min_dividend <= dividend_yield <= max_dividend
-            
-            elif scan_type == 'low_debt':
-                debt_equity = data.get('debt_equity_ratio', 10)
-                min_debt_equity = params.get('min_debt_equity', 0)
-                max_debt_equity = params.get('max_debt_equity', 1)
-                result = min_debt_equity <= debt_equity <= max_debt_equity
-                # Debug info
-                if result:
-                    print(f"✓ {data.get('symbol', 'UNKNOWN')}: B/Ö={debt_equity:.1f} (aralık: {min_debt_equity}-{max_debt_equity})")
-                return result
-            
-            elif scan_type == 'revenue_growth':
-                revenue_growth = data.get('revenue_growth', -100)
-                min_revenue_growth = params.get('min_revenue_growth', 10)
-                max_revenue_growth = params.get('max_revenue_growth', 50)
-                result = min_revenue_growth <= revenue_growth <= max_revenue_growth
-                # Debug info
-                if result:
-                    print(f"✓ {data.get('symbol', 'UNKNOWN')}: Gelir Artışı={revenue_growth:.1f}% (aralık: {min_revenue_growth}%-{max_revenue_growth}%)")
-                return result
-            
-            elif scan_type == 'profit_margin':
-                profit_margin = data.get('profit_margin', 0)
-                min_profit_margin = params.get('min_profit_margin', 10)
-                max_profit_margin = params.get('max_profit_margin', 40)
-                result = min_profit_margin <= profit_margin <= max_profit_margin
-                # Debug info
-                if result:
-                    print(f"✓ {data.get('symbol', 'UNKNOWN')}: Kar Marjı={profit_margin:.1f}% (aralık: {min_profit_margin}%-{max_profit_margin}%)")
-                return result
-            
-            elif scan_type == 'combined_value':
-                # Check all criteria for combined value screening
-                pe_ratio = data.get('pe_ratio', 100)
-                pb_ratio = data.get('pb_ratio', 100)
-                roe = data.get('roe', 0)
-                debt_equity = data.get('debt_equity_ratio', 10)
-                
-                max_pe = params.get('max_pe', 15)
-                max_pb = params.get('max_pb', 2)
-                min_roe = params.get('min_roe', 15)
-                max_debt_equity = params.get('max_debt_equity', 1)
-                
-                pe_ok = pe_ratio <= max_pe
-                pb_ok = pb_ratio <= max_pb
-                roe_ok = roe >= min_roe
-                debt_ok = debt_equity <= max_debt_equity
-                
-                result = pe_ok and pb_ok and roe_ok and debt_ok
-                # Debug info
-                if result:
-                    print(f"✓ {data.get('symbol', 'UNKNOWN')}: KOMBINE DEĞER - P/E={pe_ratio:.1f}, P/B={pb_ratio:.1f}, ROE={roe:.1f}%, B/Ö={debt_equity:.1f}")
-                return result
-            
-            elif scan_type == 'high_volume':
-                avg_volume = data.get('avg_volume', 0)
-                return avg_volume >= params.get('min_volume', 1000000)
-            
-            elif scan_type == 'momentum':
-                price_change = data.get('price_change_1m', 0)
-                return price_change >= params.get('min_momentum', 10)
-            
-            elif scan_type == 'value':
-                pe_ok = data.get('pe_ratio', 100) <= params.get('max_pe', 15)
-                pb_ok = data.get('pb_ratio', 100) <= params.get('max_pb', 2)
-                return pe_ok and pb_ok
-            
-            elif scan_type == 'growth':
-                price_3m = data.get('price_change_3m', 0)
-                price_6m = data.get('price_change_6m', 0)
-                return price_3m >= 15 and price_6m >= 25
-            
-            return True
-            
-        except Exception as e:
-            return False
+    def _passes_fundamental_criteria_batch(self, columns, scan_type, params):
+        """Check which stocks pass fundamental screening criteria; one bool per stock of columns"""
+        pget = params.get
+        
+        market_cap = columns['market_cap_est']
+        min_market_cap = pget('min_market_cap', 100) * 1000000  # Convert to TL
+        max_market_cap = pget('max_market_cap', 100000) * 1000000
+        
+        # Market cap filter (written as "not outside" so an unknown cap is not rejected)
+        cap_ok = ~((market_cap < min_market_cap) | (market_cap > max_market_cap))
+        if not cap_ok.all():
+            # Scan criteria only need evaluating on the stocks that survive the cap filter
+            if not cap_ok.any():
+                return cap_ok
+            columns = {k: v[cap_ok] for k, v in columns.items()}
+        
+        # Scan criteria ranges, checked for all stocks in one kernel call
+        bounds = _SCAN_BOUNDS.get(scan_type)
+        if bounds:
+            fields, lows, highs = zip(*bounds)
+            lows, highs = (np.array([pget(*b) if isinstance(b, tuple) else b for b in side], dtype=np.float64)
+                           for side in (lows, highs))
+            criteria = _indicators.within_bounds(np.column_stack([columns[f] for f in fields]), lows, highs)
+        else:
+            criteria = np.ones(np.count_nonzero(cap_ok), dtype=bool)
+        
+        passed = cap_ok.copy()
+        passed[cap_ok] = criteria
+        return passed
     
-    def _sort_fundamental_results(self, results, scan_type):
-        """Sort results based on scan type criteria"""
+    def _sort_fundamental_results(self, columns, scan_type):
+        """Order of the stocks in columns by scan type criteria, as an index array"""
+        n = len(columns['market_cap_est'])
+        spec = _SORT_SPEC.get(scan_type)
+        if spec is None:
+            return np.arange(n)
         try:
-            if scan_type == 'low_pe':
-                return sorted(results, key=lambda x: x.get('pe_ratio', 100))
-            elif scan_type == 'high_roe':
-                return sorted(results, key=lambda x: x.get('roe', 0), reverse=True)
-            elif scan_type == 'low_pb':
-                return sorted(results, key=lambda x: x.get('pb_ratio', 100))
-            elif scan_type == 'dividend':
-                return sorted(results, key=lambda x: x.get('dividend_yield', 0), reverse=True)
-            elif scan_type == 'low_debt':
-                return sorted(results, key=lambda x: x.get('debt_equity_ratio', 10))
-            elif scan_type == 'revenue_growth':
-                return sorted(results, key=lambda x: x.get('revenue_growth', -100), reverse=True)
-            elif scan_type == 'profit_margin':
-                return sorted(results, key=lambda x: x.get('profit_margin', 0), reverse=True)
-            elif scan_type == 'combined_value':
-                # Sort by best overall value score (low P/E + low P/B + high ROE + low debt)
-                return sorted(results, key=lambda x: (x.get('pe_ratio', 100) + x.get('pb_ratio', 100)) - x.get('roe', 0) + x.get('debt_equity_ratio', 10))
-            elif scan_type == 'high_volume':
-                return sorted(results, key=lambda x: x.get('avg_volume', 0), reverse=True)
-            elif scan_type == 'momentum':
-                return sorted(results, key=lambda x: x.get('price_change_1m', 0), reverse=True)
-            elif scan_type == 'value':
-                return sorted(results, key=lambda x: x.get('pe_ratio', 100) + x.get('pb_ratio', 100))
-            elif scan_type == 'growth':
-                return sorted(results, key=lambda x: x.get('price_change_3m', 0) + x.get('price_change_6m', 0), reverse=True)
-            else:
-                return results
-        except:
-            return results
+            key, ascending = spec
+            keys = key(columns) if callable(key) else columns[key]
+            # Stable on the negated key so ties keep their order when sorting descending
+            return np.argsort(keys if ascending else -keys, kind='stable')
+        except Exception:
+            return np.arange(n)
@@ -3,12 +3,38 @@ import numpy as np
 from datetime import datetime, timedelta
 import yfinance as yf
 import time
+import functools
+from collections import OrderedDict
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+@functools.lru_cache(maxsize=None)
+def to_yf_symbol(symbol):
+    """Yahoo Finance ticker for a BIST symbol (adds the .IS suffix once per symbol)"""
+    return symbol if symbol.endswith('.IS') else f"{symbol}.IS"
+
+
+# Prices are stored as float32: ample precision for scoring at half the memory. Volume
+# stays float64 since daily share counts exceed float32's exact integer range (2**24).
+# Analysis code converts to float64 before accumulating.
+_OHLCV_DTYPES = {'open': 'float32', 'high': 'float32', 'low': 'float32', 'close': 'float32', 'volume': 'float64'}
+
+_PRICE_CACHE_DIR = '.bist_price_cache'
+_PRICE_CACHE_TTL = 3600  # seconds
+_PRICE_CACHE_MAXSIZE = 1024  # in-memory frames, comfortably above the BIST universe
+
 
 class TradingViewDataFetcher:
     """Data fetcher for stock data using Yahoo Finance as fallback"""
     
     def __init__(self):
         self.session = None
+        # LRU of (symbol, period, interval) -> (fetched_at, cleaned DataFrame)
+        self._mem_cache = OrderedDict()
+        self._mem_cache_lock = threading.Lock()
         
     def get_stock_data(self, symbol, period='5d', interval='1d'):
         """
@@ -22,15 +48,35 @@ class TradingViewDataFetcher:
         Returns:
             pandas.DataFrame: Stock data with OHLCV columns
         """
+        key = (symbol, period, interval)
+        with self._mem_cache_lock:
+            entry = self._mem_cache.get(key)
+            if entry is not None:
+                self._mem_cache.move_to_end(key)
+        
+        # Entries expire by when the data was fetched, whether in memory or on disk
+        if entry is None or time.time() - entry[0] >= _PRICE_CACHE_TTL:
+            entry = self._load_price_cache(symbol, period, interval)
+            if entry is None:
+                data = self._fetch_stock_data(symbol, period, interval)
+                if data is None:
+                    return None
+                self._save_price_cache(symbol, period, interval, data)
+                entry = (time.time(), data)
+            with self._mem_cache_lock:
+                self._mem_cache[key] = entry
+                self._mem_cache.move_to_end(key)
+                while len(self._mem_cache) > _PRICE_CACHE_MAXSIZE:
+                    self._mem_cache.popitem(last=False)
+        
+        # Callers attach indicator columns in place, so never hand out the cached frame
+        return entry[1].copy()
+    
+    def _fetch_stock_data(self, symbol, period, interval):
+        """Download and clean one symbol's history from Yahoo Finance"""
         try:
-            # Add .IS suffix for BIST stocks if not present
-            if not symbol.endswith('.IS'):
-                yf_symbol = f"{symbol}.IS"
-            else:
-                yf_symbol = symbol
-            
-            # Create ticker object
-            ticker = yf.Ticker(yf_symbol)
+            # Create ticker object (BIST stocks need the .IS suffix)
+            ticker = yf.Ticker(to_yf_symbol(symbol))
             
             # Fetch data with interval
             data = ticker.history(period=period, interval=interval)
@@ -59,57 +105,127 @@ class TradingViewDataFetcher:
             print(f"Error fetching data for {symbol}: {str(e)}")
             return None
     
+    def _price_cache_path(self, symbol, period, interval):
+        return os.path.join(_PRICE_CACHE_DIR, f"{symbol}_{period}_{interval}.pkl")
+    
+    def _load_price_cache(self, symbol, period, interval):
+        """(fetched_at, price history) cached on disk within _PRICE_CACHE_TTL, else None"""
+        path = self._price_cache_path(symbol, period, interval)
+        try:
+            if not os.path.exists(path):
+                return None
+            fetched_at = os.path.getmtime(path)
+            if time.time() - fetched_at >= _PRICE_CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                return fetched_at, pickle.load(f)
+        except Exception as e:
+            print(f"Error reading price cache for {symbol}: {str(e)}")
+            return None
+    
+    def _save_price_cache(self, symbol, period, interval, data):
+        """Persist a price history; written to a temp file first so readers never see a partial file"""
+        path = self._price_cache_path(symbol, period, interval)
+        try:
+            os.makedirs(_PRICE_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error writing price cache for {symbol}: {str(e)}")
+    
     def _clean_data(self, data):
         """Clean and validate stock data"""
         if data is None or data.empty:
             return None
         
-        # Remove rows with NaN values in critical columns
-        data = data.dropna(subset=['close', 'volume'])
-        
-        # Remove rows with zero volume (invalid data)
-        data = data[data['volume'] > 0]
-        
-        # Remove rows with zero or negative prices
-        data = data[data['close'] > 0]
-        data = data[data['high'] > 0]
-        data = data[data['low'] > 0]
-        data = data[data['open'] > 0]
+        # One combined row mask instead of a filtered copy per condition. Comparisons
+        # with NaN are False, so this also drops rows missing any OHLCV value.
+        o, h, l, c, v = data[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64).T
+        rows = np.flatnonzero((v > 0) & (c > 0) & (h > 0) & (l > 0) & (o > 0) & (h >= l))
         
-        # Ensure high >= low >= 0
-        data = data[data['high'] >= data['low']]
+        # Sort by index (date); yfinance already returns bars in order, so this is usually skipped
+        if not data.index.is_monotonic_increasing:
+            rows = rows[np.argsort(data.index.to_numpy()[rows], kind='stable')]
         
-        # Sort by index (date)
-        data = data.sort_index()
-        
-        return data
+        # Filter and reorder with a single row selection
+        return data.iloc[rows].astype(_OHLCV_DTYPES)
     
-    def get_multiple_stocks_data(self, symbols, period='5d', interval='1d'):
+    def get_stocks_data_batch(self, symbols, period='5d', interval='1d', batch_size=20):
         """
-        Fetch data for multiple stocks
+        Fetch data for many stocks with one yf.download request per batch
         
         Args:
             symbols (list): List of stock symbols
             period (str): Time period
             interval (str): Data interval
+            batch_size (int): Symbols per download request
             
         Returns:
             dict: Dictionary with symbol as key and DataFrame as value
         """
         results = {}
+        required_columns = ['open', 'high', 'low', 'close', 'volume']
         
-        for symbol in symbols:
+        for start in range(0, len(symbols), batch_size):
+            batch = symbols[start:start + batch_size]
+            yf_symbols = {to_yf_symbol(s): s for s in batch}
             try:
-                data = self.get_stock_data(symbol, period, interval)
-                if data is not None:
-                    results[symbol] = data
-                
-                # Rate limiting to avoid being blocked
-                time.sleep(0.2)
-                
+                raw = yf.download(tickers=' '.join(yf_symbols), period=period, interval=interval,
+                                  group_by='ticker', auto_adjust=True, progress=False, threads=True)
             except Exception as e:
-                print(f"Error fetching {symbol}: {str(e)}")
+                print(f"Error downloading batch starting at {batch[0]}: {str(e)}")
+                continue
+            
+            if raw is None or raw.empty:
                 continue
+            
+            # Lower-case the field level once for the whole batch instead of per symbol
+            raw.columns = raw.columns.set_levels(raw.columns.levels[-1].str.lower(), level=-1)
+            downloaded = set(raw.columns.get_level_values(0))
+            
+            for yf_symbol, symbol in yf_symbols.items():
+                try:
+                    if yf_symbol not in downloaded:
+                        continue
+                    data = raw[yf_symbol].dropna(how='all')
+                    if data.empty or any(col not in data.columns for col in required_columns):
+                        continue
+                    data = self._clean_data(data)
+                    if data is not None and not data.empty:
+                        results[symbol] = data
+                except Exception as e:
+                    print(f"Error reading batch data for {symbol}: {str(e)}")
+        
+        return results
+    
+    def get_multiple_stocks_data(self, symbols, period='5d', interval='1d', max_workers=16):
+        """
+        Fetch data for multiple stocks
+        
+        Args:
+            symbols (list): List of stock symbols
+            period (str): Time period
+            interval (str): Data interval
+            max_workers (int): Concurrent requests for symbols missing from the batches
+            
+        Returns:
+            dict: Dictionary with symbol as key and DataFrame as value
+        """
+        # Batched yf.download requests instead of one throttled request per symbol
+        results = self.get_stocks_data_batch(list(symbols), period, interval)
+        
+        # Symbols a failed or partial batch left out are retried one by one,
+        # concurrently since each request just waits on the network
+        missing = [s for s in symbols if s not in results]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                futures = {executor.submit(self.get_stock_data, s, period, interval): s for s in missing}
+                for future in as_completed(futures):
+                    data = future.result()
+                    if data is not None:
+                        results[futures[future]] = data
         
         return results
     
@@ -129,20 +245,23 @@ class TradingViewDataFetcher:
         issues = []
         score = 100
         
+        # All checks read the underlying arrays instead of building a Series per check
+        high, low, volume = data[['high', 'low', 'volume']].to_numpy(dtype=np.float64).T
+        
         # Check for missing values
-        missing_pct = data.isnull().sum().sum() / (len(data) * len(data.columns)) * 100
+        missing_pct = pd.isna(data.to_numpy()).mean() * 100
         if missing_pct > 0:
             issues.append(f"Missing values: {missing_pct:.1f}%")
             score -= missing_pct * 2
         
         # Check for zero volumes
-        zero_volume_pct = (data['volume'] == 0).sum() / len(data) * 100
+        zero_volume_pct = (volume == 0).mean() * 100
         if zero_volume_pct > 0:
             issues.append(f"Zero volume periods: {zero_volume_pct:.1f}%")
             score -= zero_volume_pct * 3
         
         # Check for price anomalies (high < low)
-        price_anomalies = (data['high'] < data['low']).sum()
+        price_anomalies = int(np.count_nonzero(high < low))
         if price_anomalies > 0:
             issues.append(f"Price anomalies: {price_anomalies}")
             score -= price_anomalies * 10
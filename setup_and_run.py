@@ -49,8 +49,7 @@ def check_files():
 def run_application():
     """Streamlit uygulamasını başlat"""
     try:
-        print("\n🚀 BIST Analiz Uygulaması başlatılıyor...")        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        install.bat        install.bat        install.bat        install.bat        install.bat        run_app.bat        pip install -r requirements.txt        pip install -r requirements.txt        pip install -r requirements.txt        python test_app.py        python test_app.py        python test_app.py        python test_app.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        python setup_and_run.py        pip install -r requirements.txt
-        streamlit run app.py        python test_app.py        python test_app.py        python test_app.py
+        print("\n🚀 BIST Analiz Uygulaması başlatılıyor...")
         print("📱 Tarayıcınızda http://localhost:8501 adresine gidin")
         print("⏹️  Uygulamayı durdurmak için Ctrl+C basın")
         print("-" * 50)
@@ -116,6 +116,99 @@ def test_analyzer():
         traceback.print_exc()
         return False
 
+def test_price_cache():
+    """Fiyat önbelleği: kopya döndürme, süre aşımı ve LRU sınırı (yf.Ticker taklit edilir)"""
+    print("\n🗄️  Fiyat önbelleği testi...")
+    
+    import os
+    import tempfile
+    import time
+    import numpy as np
+    import pandas as pd
+    import data_fetcher
+    
+    calls = []
+    
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+        
+        def history(self, period, interval):
+            calls.append(self.symbol)
+            close = np.linspace(10.0, 20.0, 30)
+            return pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99,
+                                 'Close': close, 'Volume': np.full(30, 1e6)},
+                                index=pd.date_range('2024-01-01', periods=30, freq='D'))
+    
+    saved = (data_fetcher.yf.Ticker, data_fetcher._PRICE_CACHE_DIR, data_fetcher._PRICE_CACHE_MAXSIZE)
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            data_fetcher.yf.Ticker = FakeTicker
+            data_fetcher._PRICE_CACHE_DIR = cache_dir
+            fetcher = data_fetcher.TradingViewDataFetcher()
+            
+            # A cache hit returns a copy, so in-place changes don't leak into the cache
+            first = fetcher.get_stock_data('THYAO', period='1mo')
+            first['extra'] = 1.0
+            second = fetcher.get_stock_data('THYAO', period='1mo')
+            assert len(calls) == 1 and 'extra' not in second.columns
+            
+            # An entry older than the TTL (in memory and on disk) is refetched
+            key = ('THYAO', '1mo', '1d')
+            stale = time.time() - data_fetcher._PRICE_CACHE_TTL - 1
+            fetcher._mem_cache[key] = (stale, fetcher._mem_cache[key][1])
+            path = fetcher._price_cache_path(*key)
+            os.utime(path, (stale, stale))
+            fetcher.get_stock_data('THYAO', period='1mo')
+            assert len(calls) == 2
+            
+            # The in-memory LRU evicts the least recently used entries past its max size
+            data_fetcher._PRICE_CACHE_MAXSIZE = 2
+            for symbol in ('AKBNK', 'GARAN'):
+                fetcher.get_stock_data(symbol, period='1mo')
+            assert list(fetcher._mem_cache) == [('AKBNK', '1mo', '1d'), ('GARAN', '1mo', '1d')]
+        
+        print("✅ Fiyat önbelleği doğru çalışıyor")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Fiyat önbelleği hatası: {e!r}")
+        traceback.print_exc()
+        return False
+    finally:
+        data_fetcher.yf.Ticker, data_fetcher._PRICE_CACHE_DIR, data_fetcher._PRICE_CACHE_MAXSIZE = saved
+
+def test_within_bounds_parity():
+    """Tarama aralık kontrolünün derlenmiş/döngü ve NumPy sürümleri aynı sonucu vermeli"""
+    print("\n🧮 Tarama aralık kernel testi...")
+    
+    try:
+        import numpy as np
+        import _indicators
+        
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            values = rng.normal(0, 2, size=(200, 4))
+            values[rng.random(values.shape) < 0.1] = np.nan
+            values[rng.random(values.shape) < 0.02] = np.inf
+            values[rng.random(values.shape) < 0.02] = -np.inf
+            lows = np.where(rng.random(4) < 0.3, -np.inf, rng.normal(-1, 1, 4))
+            highs = np.where(rng.random(4) < 0.3, np.inf, rng.normal(1, 1, 4))
+            
+            expected = _indicators._within_bounds_numpy(values, lows, highs)
+            assert np.array_equal(_indicators._within_bounds_loop(values, lows, highs), expected)
+            assert np.array_equal(_indicators.within_bounds(values, lows, highs), expected)
+            # NaN values never pass, whatever the bounds
+            assert not expected[np.isnan(values).any(axis=1)].any()
+        
+        print(f"✅ within_bounds sürümleri uyumlu (numba: {_indicators.NUMBA_AVAILABLE})")
+        return True
+        
+    except Exception as e:
+        print(f"❌ within_bounds uyumsuzluğu: {e!r}")
+        traceback.print_exc()
+        return False
+
 def main():
     """Ana test fonksiyonu"""
     print("=" * 60)
@@ -146,6 +239,14 @@ def main():
         print("\n❌ Analiz motoru hatası!")
         all_passed = False
     
+    # 5. Fiyat önbelleği testi (çevrimdışı)
+    if not test_price_cache():
+        all_passed = False
+    
+    # 6. Tarama aralık kernel testi (çevrimdışı)
+    if not test_within_bounds_parity():
+        all_passed = False
+    
     # Sonuç
     print("\n" + "=" * 60)
     if all_passed:
@@ -2,23 +2,22 @@ import re
 import sys
 from pathlib import Path
 
+import numpy as np
+
+# Single-letter markers and category tags that look like tickers
+SKIP = {'G', 'D', 'REIT', 'CEF'}
+
+# A ticker is a whole line of 2-6 uppercase alnum characters, no spaces; this
+# leaves out Turkish full names (spaces or non-ascii letters) but keeps pure
+# tickers like THYAO, ASELS, ALBRK, etc.
+TICKER_LINE = re.compile(r'^\s*([A-Z0-9]{2,6})\s*$', re.MULTILINE)
+
+
 def parse_symbols(text: str):
-    lines = text.splitlines()
-    out = []
-    for line in lines:
-        s = (line or '').strip().upper()
-        if not s:
-            continue
-        # Skip single letters/markers and category tags
-        if s in {'G', 'D', 'REIT', 'CEF'}:
-            continue
-        # Ignore obvious Turkish full names (contain space or non-ascii letters)
-        # but keep pure tickers like THYAO, ASELS, ALBRK, etc.
-        # A ticker is 2-6 uppercase alnum characters, no spaces
-        if re.fullmatch(r'[A-Z0-9]{2,6}', s):
-            out.append(s)
-    # dedupe and sort
-    return sorted(list(set(out)))
+    # One scan over the whole upper-cased buffer, deduped into a set and sorted directly
+    syms = set(TICKER_LINE.findall(text.upper()))
+    syms -= SKIP
+    return sorted(syms)
 
 
 def main():
@@ -26,13 +25,22 @@ def main():
     if not raw_path.exists():
         print('raw_bist_list.txt not found.')
         sys.exit(1)
+    out_path = Path('bist_tickers.txt')
+    npy_path = out_path.with_suffix('.npy')
+    # Nothing to do if both outputs are newer than the raw list (pass --force to rebuild)
+    raw_mtime = raw_path.stat().st_mtime
+    if ('--force' not in sys.argv and all(p.exists() and p.stat().st_mtime >= raw_mtime
+                                          for p in (out_path, npy_path))):
+        print(f'{out_path} is up to date.')
+        return
     text = raw_path.read_text(encoding='utf-8', errors='ignore')
     syms = parse_symbols(text)
     # Write to bist_tickers.txt
-    out_path = Path('bist_tickers.txt')
     header = '# Auto-generated from raw_bist_list.txt by tools/parse_tickers.py\n'
     out_path.write_text(header + '\n'.join(syms) + '\n', encoding='utf-8')
-    print(f'Parsed {len(syms)} symbols -> {out_path}')
+    # Binary copy the analyzer loads without parsing text
+    np.save(npy_path, np.array(syms, dtype='U6'))
+    print(f'Parsed {len(syms)} symbols -> {out_path}, {npy_path}')
 
 if __name__ == '__main__':
     main()